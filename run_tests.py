@@ -13,10 +13,12 @@ def main():
     parser = argparse.ArgumentParser(description="Run tests for Jira Spec Sheet Sync")
     parser.add_argument("--unit", action="store_true", help="Run only unit tests")
     parser.add_argument("--integration", action="store_true", help="Run only integration tests")
+    parser.add_argument("--fast", action="store_true", help="Skip tests marked as slow")
     parser.add_argument("--coverage", action="store_true", help="Run with coverage report")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--pattern", "-k", help="Run tests matching pattern")
     parser.add_argument("--file", "-f", help="Run specific test file")
+    parser.add_argument("--workers", "-n", help="Run tests in parallel on N workers, or 'auto' for one per CPU")
     parser.add_argument("--install-deps", action="store_true", help="Install test dependencies first")
     
     args = parser.parse_args()
@@ -29,7 +31,7 @@ def main():
     if args.install_deps:
         print("📦 Installing test dependencies...")
         try:
-            subprocess.run([sys.executable, "-m", "pip", "install", "pytest", "pytest-cov"], check=True)
+            subprocess.run([sys.executable, "-m", "pip", "install", "pytest", "pytest-cov", "pytest-xdist"], check=True)
             print("✅ Dependencies installed successfully")
         except subprocess.CalledProcessError as e:
             print(f"❌ Failed to install dependencies: {e}")
@@ -44,14 +46,22 @@ def main():
     if args.coverage:
         cmd.extend(["--cov=utils", "--cov=spec-sheet", "--cov-report=html", "--cov-report=term"])
     
+    markers = []
     if args.unit:
-        cmd.extend(["-m", "unit"])
+        markers.append("unit")
     elif args.integration:
-        cmd.extend(["-m", "integration"])
+        markers.append("integration")
+    if args.fast:
+        markers.append("not slow")
+    if markers:
+        cmd.extend(["-m", " and ".join(markers)])
     
     if args.pattern:
         cmd.extend(["-k", args.pattern])
     
+    if args.workers:
+        cmd.extend(["-n", args.workers])
+    
     if args.file:
         cmd.append(f"tests/{args.file}")
     else:
@@ -7,7 +7,6 @@ Handles Excel spreadsheet operations, formatting, and content generation
 import openpyxl
 from openpyxl.styles import Font, PatternFill, Alignment
 from typing import Dict, List, Any
-import pandas as pd
 import os
 from spec_sheet.settings.config_manager import ConfigManager
 
@@ -317,6 +316,9 @@ class ExcelManager:
     
     def load_dod_impacts_from_sheet(self) -> Dict[str, float]:
         """Load Definition of Done impacts from the spec sheet"""
+        # pandas is only needed here; importing it lazily keeps module import cheap
+        import pandas as pd
+        
         dod_impacts = {}
         try:
             df = pd.read_excel(self.spec_sheet_path, sheet_name='Definition of Done (Quality)')
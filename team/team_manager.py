@@ -6,13 +6,91 @@ Handles team member creation, holiday management, and persistent storage
 
 import json
 import os
+import re
+import string
+from bisect import bisect_right
 from datetime import datetime, date
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, field, fields
 import sys
 sys.path.insert(0, '..')
 
-@dataclass
+# Sidecar file mapping member file names to display names
+INDEX_FILENAME = "_index.json"
+
+# save_member always writes "name" as the first key, so it can be read from the file head
+_NAME_HEAD_BYTES = 512
+_NAME_RE = re.compile(rb'^\s*\{\s*"name"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+# Deletes every ASCII character that may not appear in a member file name
+_SAFE_NAME_CHARS = set(string.ascii_letters + string.digits + ' -_')
+_UNSAFE_ASCII_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if chr(c) not in _SAFE_NAME_CHARS))
+
+@lru_cache(maxsize=4096)
+def _parse_iso(date_str: str) -> date:
+    """Parse a YYYY-MM-DD holiday date, caching repeated strings
+    
+    strptime rather than date.fromisoformat, so hand-edited files with unpadded
+    dates like 2025-7-4 keep loading.
+    """
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+def _read_json(file_path: str) -> Any:
+    """Read and parse a JSON file with a single binary read"""
+    with open(file_path, 'rb') as f:
+        return json.loads(f.read())
+
+def _read_member_name(file_path: str) -> str:
+    """Read a member's name from the start of its file, parsing the whole file only if needed"""
+    with open(file_path, 'rb') as f:
+        match = _NAME_RE.match(f.read(_NAME_HEAD_BYTES))
+    if match:
+        return json.loads(match.group(1))
+    return _read_json(file_path)['name']
+
+def _write_json(file_path: str, data: Any, pretty: bool = False):
+    """Atomically write JSON by writing a temp file and renaming it over the target"""
+    tmp_path = file_path + '.tmp'
+    try:
+        with open(tmp_path, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2)
+            else:
+                json.dump(data, f, separators=(',', ':'))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        # Don't leave a half-written temp file next to the member files
+        try:
+            os.remove(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+def _public_fields(obj) -> Dict[str, Any]:
+    """Shallow dict of a dataclass's public fields, skipping cached _private ones"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj) if not f.name.startswith('_')}
+
+class _HolidayList(list):
+    """List of holidays that counts its own changes, so indexes know when to rebuild"""
+    version = 0
+
+
+def _count_change(method):
+    """Wrap a list method so it bumps the list's version first"""
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    mutate.__name__ = method.__name__
+    return mutate
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(_HolidayList, _name, _count_change(getattr(list, _name)))
+
+
+@dataclass(slots=True)
 class Holiday:
     """Represents a holiday for a team member"""
     start_date: str  # YYYY-MM-DD format
@@ -20,14 +98,33 @@ class Holiday:
     name: str
     is_national: bool = False
     
+    # Bumped whenever an existing holiday's dates are edited in place
+    date_edits = 0
+    
+    def __setattr__(self, name: str, value: Any):
+        # name is assigned after the dates, so construction itself does not count as an edit
+        if name in ('start_date', 'end_date') and hasattr(self, 'name'):
+            Holiday.date_edits += 1
+        object.__setattr__(self, name, value)
+    
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return _public_fields(self)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Holiday':
         return cls(**data)
+    
+    @staticmethod
+    def _fast_new(data: Dict[str, Any]) -> 'Holiday':
+        """Build a Holiday from stored data without going through __init__ (bulk loads)"""
+        holiday = object.__new__(Holiday)
+        holiday.start_date = data['start_date']
+        holiday.end_date = data['end_date']
+        holiday.name = data['name']
+        holiday.is_national = data.get('is_national', False)
+        return holiday
 
-@dataclass
+@dataclass(slots=True)
 class TeamMember:
     """Represents a team member with their details and holidays"""
     name: str
@@ -37,10 +134,42 @@ class TeamMember:
     hourly_rate: float = 95.37
     email: Optional[str] = None
     holidays: List[Holiday] = None
+    _sorted_starts: List[date] = field(init=False, repr=False, compare=False, default=None)
+    _sorted_ends: List[date] = field(init=False, repr=False, compare=False, default=None)
+    _sorted_holidays: List[Holiday] = field(init=False, repr=False, compare=False, default=None)
+    _max_end_prefix: List[date] = field(init=False, repr=False, compare=False, default=None)
+    _indexed_list: Optional[List[Holiday]] = field(init=False, repr=False, compare=False, default=None)
+    _indexed_version: tuple = field(init=False, repr=False, compare=False, default=None)
     
     def __post_init__(self):
-        if self.holidays is None:
-            self.holidays = []
+        self.holidays = _HolidayList(self.holidays or [])
+    
+    def _index_is_current(self) -> bool:
+        """Check the index against the holidays list and its version, without scanning it"""
+        return (self._indexed_list is self.holidays
+                and self._indexed_version == (self.holidays.version, Holiday.date_edits))
+    
+    def _rebuild_index(self):
+        """Rebuild the sorted holiday index used by get_holidays_in_range"""
+        if type(self.holidays) is not _HolidayList:
+            # holidays was replaced with a plain list, track changes to it from now on
+            self.holidays = _HolidayList(self.holidays)
+        entries = sorted(
+            (_parse_iso(holiday.start_date), _parse_iso(holiday.end_date), index)
+            for index, holiday in enumerate(self.holidays)
+        )
+        self._sorted_starts = [start for start, _, _ in entries]
+        self._sorted_ends = [end for _, end, _ in entries]
+        self._sorted_holidays = [self.holidays[index] for _, _, index in entries]
+        
+        # Running max of end dates lets a backwards scan stop early
+        self._max_end_prefix = []
+        max_end = None
+        for end in self._sorted_ends:
+            max_end = end if max_end is None or end > max_end else max_end
+            self._max_end_prefix.append(max_end)
+        self._indexed_list = self.holidays
+        self._indexed_version = (self.holidays.version, Holiday.date_edits)
     
     def add_holiday(self, start_date: str, end_date: str, name: str, is_national: bool = False):
         """Add a holiday for this team member"""
@@ -49,71 +178,125 @@ class TeamMember:
     
     def get_holidays_in_range(self, start_date: date, end_date: date) -> List[Holiday]:
         """Get holidays that overlap with the given date range"""
+        if not self._index_is_current():
+            # First query, or holidays changed since the index was built
+            self._rebuild_index()
+        
         overlapping = []
-        for holiday in self.holidays:
-            h_start = datetime.strptime(holiday.start_date, '%Y-%m-%d').date()
-            h_end = datetime.strptime(holiday.end_date, '%Y-%m-%d').date()
-            
-            # Check if holidays overlap with the range
-            if h_start <= end_date and h_end >= start_date:
-                overlapping.append(holiday)
+        i = bisect_right(self._sorted_starts, end_date)
+        for j in range(i - 1, -1, -1):
+            if self._max_end_prefix[j] < start_date:
+                break
+            if self._sorted_ends[j] >= start_date:
+                overlapping.append(self._sorted_holidays[j])
         
+        overlapping.reverse()
         return overlapping
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
+        data = _public_fields(self)
         data['holidays'] = [holiday.to_dict() for holiday in self.holidays]
         return data
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'TeamMember':
-        holidays_data = data.pop('holidays', [])
-        member = cls(**data)
-        member.holidays = [Holiday.from_dict(h) for h in holidays_data]
-        return member
+        holidays_data = data.pop('holidays', None) or []
+        return cls(**data, holidays=[Holiday._fast_new(h) for h in holidays_data])
 
 class TeamManager:
     """Manages team members and their persistent storage"""
     
-    def __init__(self, team_folder: str = "team/members"):
+    def __init__(self, team_folder: str = "team/members", verbose: bool = False):
         self.team_folder = team_folder
+        self.verbose = verbose  # print status messages for saves/deletes (the CLI turns this on)
+        self._index_path = os.path.join(team_folder, INDEX_FILENAME)
         self.ensure_team_folder()
     
     def ensure_team_folder(self):
         """Create team folder if it doesn't exist"""
         if not os.path.exists(self.team_folder):
             os.makedirs(self.team_folder)
-            print(f"📁 Created team folder: {self.team_folder}")
+            if self.verbose:
+                print(f"📁 Created team folder: {self.team_folder}")
     
     def get_member_file_path(self, name: str) -> str:
         """Get the file path for a team member"""
-        safe_name = "".join(c if c.isalnum() or c in (' ', '-', '_') else '' for c in name)
+        safe_name = name.translate(_UNSAFE_ASCII_TABLE)
+        if not safe_name.isascii():
+            # Keep non-ASCII letters and digits, as before
+            safe_name = "".join(c for c in safe_name if c.isascii() or c.isalnum())
         safe_name = safe_name.replace(' ', '_').lower()
+        if f"{safe_name}.json" == INDEX_FILENAME:
+            raise ValueError(f"'{name}' is reserved for the member index")
         return os.path.join(self.team_folder, f"{safe_name}.json")
     
-    def save_member(self, member: TeamMember) -> bool:
-        """Save a team member to disk"""
+    def _index_key(self, file_path: str) -> str:
+        """Get the index key (file name without extension) for a member file"""
+        return os.path.splitext(os.path.basename(file_path))[0]
+    
+    def _load_index(self) -> Dict[str, str]:
+        """Load the member index, syncing it with the member files on disk
+        
+        Files copied in or removed by hand are picked up by comparing the index
+        keys with the file names; only new files are read.
+        """
+        try:
+            index = _read_json(self._index_path)
+        except (FileNotFoundError, ValueError):
+            index = None  # Missing or unreadable, rebuild it from the member files
+        
+        on_disk = {
+            self._index_key(file): file
+            for file in os.listdir(self.team_folder)
+            if file.endswith('.json') and file != INDEX_FILENAME
+        }
+        if not isinstance(index, dict) or index.keys() != on_disk.keys():
+            known = index if isinstance(index, dict) else {}
+            index = {
+                key: known[key] if key in known else _read_member_name(os.path.join(self.team_folder, file))
+                for key, file in on_disk.items()
+            }
+            self._write_index(index)
+        return index
+    
+    def _write_index(self, index: Dict[str, str]):
+        """Atomically write the member index"""
+        _write_json(self._index_path, index)
+    
+    def save_member(self, member: TeamMember, pretty: bool = False) -> bool:
+        """Save a team member to disk (pretty=True writes indented JSON)"""
         try:
             file_path = self.get_member_file_path(member.name)
-            with open(file_path, 'w') as f:
-                json.dump(member.to_dict(), f, indent=2)
-            print(f"💾 Saved team member: {member.name} to {file_path}")
-            return True
+            _write_json(file_path, member.to_dict(), pretty)
         except Exception as e:
             print(f"❌ Error saving team member {member.name}: {e}")
             return False
+        
+        self._update_index(self._index_key(file_path), member.name)
+        if self.verbose:
+            print(f"💾 Saved team member: {member.name} to {file_path}")
+        return True
+    
+    def _update_index(self, key: str, name: Optional[str] = None):
+        """Record a saved (name given) or deleted member in the index, best effort
+        
+        The member file is already written or removed at this point, and
+        _load_index repairs any mismatch later, so a failure here is only reported.
+        """
+        try:
+            index = self._load_index()  # Picks up added and removed files itself
+            if name is not None and index.get(key) != name:
+                index[key] = name
+                self._write_index(index)
+        except Exception as e:
+            print(f"⚠️  Could not update team member index: {e}")
     
     def load_member(self, name: str) -> Optional[TeamMember]:
         """Load a team member from disk"""
         try:
-            file_path = self.get_member_file_path(name)
-            if not os.path.exists(file_path):
-                return None
-            
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-            
-            return TeamMember.from_dict(data)
+            return TeamMember.from_dict(_read_json(self.get_member_file_path(name)))
+        except FileNotFoundError:
+            return None
         except Exception as e:
             print(f"❌ Error loading team member {name}: {e}")
             return None
@@ -124,43 +307,53 @@ class TeamManager:
             if not os.path.exists(self.team_folder):
                 return []
             
-            members = []
-            for file in os.listdir(self.team_folder):
-                if file.endswith('.json'):
-                    # Load to get actual name
-                    file_path = os.path.join(self.team_folder, file)
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        members.append(data['name'])
-            
-            return sorted(members)
+            return sorted(self._load_index().values())
         except Exception as e:
             print(f"❌ Error listing team members: {e}")
             return []
     
     def load_all_members(self) -> List[TeamMember]:
-        """Load all team members"""
+        """Load all team members, reading each member file once"""
+        if not os.path.exists(self.team_folder):
+            return []
+        
         members = []
-        for name in self.list_members():
-            member = self.load_member(name)
-            if member:
-                members.append(member)
-        return members
+        for entry in os.scandir(self.team_folder):
+            if not entry.name.endswith('.json') or entry.name == INDEX_FILENAME:
+                continue
+            try:
+                members.append(TeamMember.from_dict(_read_json(entry.path)))
+            except Exception as e:
+                print(f"❌ Error loading team member file {entry.name}: {e}")
+        
+        return sorted(members, key=lambda member: member.name)
+    
+    def snapshot(self) -> Dict[str, TeamMember]:
+        """Load all team members in one pass, keyed by name in name order"""
+        return {member.name: member for member in self.load_all_members()}
+    
+    def delete_member_by_obj(self, member: TeamMember) -> bool:
+        """Delete an already loaded team member"""
+        return self.delete_member(member.name)
     
     def delete_member(self, name: str) -> bool:
         """Delete a team member"""
         try:
             file_path = self.get_member_file_path(name)
-            if os.path.exists(file_path):
+            try:
                 os.remove(file_path)
-                print(f"🗑️  Deleted team member: {name}")
-                return True
-            else:
-                print(f"⚠️  Team member not found: {name}")
+            except FileNotFoundError:
+                if self.verbose:
+                    print(f"⚠️  Team member not found: {name}")
                 return False
         except Exception as e:
             print(f"❌ Error deleting team member {name}: {e}")
             return False
+        
+        self._update_index(self._index_key(file_path))
+        if self.verbose:
+            print(f"🗑️  Deleted team member: {name}")
+        return True
     
     def create_member_interactive(self) -> Optional[TeamMember]:
         """Interactively create a new team member"""
@@ -279,7 +472,7 @@ class TeamManager:
                 print(f"✅ Added holiday: {holiday_name} ({start_date} to {end_date})")
             
             # Save member
-            if self.save_member(member):
+            if self.save_member(member, pretty=True):
                 print(f"\n✅ Team member '{member.name}' created successfully!")
                 return member
             else:
@@ -297,7 +490,7 @@ class TeamManager:
                 date_str = input(prompt).strip()
                 if not date_str:
                     return None
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
+                return _parse_iso(date_str)
             except ValueError:
                 print("❌ Invalid date format. Use YYYY-MM-DD (e.g., 2024-12-25)")
     
@@ -308,6 +501,10 @@ class TeamManager:
             print(f"❌ Team member '{member_name}' not found")
             return False
         
+        return self.add_holiday_to_member_obj(member)
+    
+    def add_holiday_to_member_obj(self, member: TeamMember) -> bool:
+        """Add a holiday to an already loaded team member and save it"""
         print(f"\n🏖️  Add Holiday for {member.name}")
         
         holiday_name = input("Holiday name: ").strip()
@@ -334,7 +531,7 @@ class TeamManager:
                          holiday_name, 
                          is_national)
         
-        if self.save_member(member):
+        if self.save_member(member, pretty=True):
             print(f"✅ Added holiday '{holiday_name}' to {member.name}")
             return True
         else:
@@ -348,6 +545,10 @@ class TeamManager:
             print(f"❌ Team member '{member_name}' not found")
             return
         
+        self.show_member_details_obj(member)
+    
+    def show_member_details_obj(self, member: TeamMember):
+        """Show detailed information about an already loaded team member"""
         print(f"\n👤 {member.name}")
         print("=" * (len(member.name) + 4))
         print(f"Role: {member.role}")
@@ -367,7 +568,7 @@ class TeamManager:
     
     def list_all_members(self):
         """List all team members with summary"""
-        members = self.list_members()
+        members = self.load_all_members()
         
         if not members:
             print("👥 No team members found. Create some with option 1!")
@@ -376,17 +577,30 @@ class TeamManager:
         print(f"\n👥 Team Members ({len(members)}):")
         print("=" * 30)
         
-        for name in members:
-            member = self.load_member(name)
-            if member:
-                holiday_count = len(member.holidays)
-                print(f"   👤 {member.name} ({member.role}) - {holiday_count} holidays")
+        for member in members:
+            holiday_count = len(member.holidays)
+            print(f"   👤 {member.name} ({member.role}) - {holiday_count} holidays")
         
         print(f"\n💡 Use 'Show Member Details' to see full information")
 
+def _select_member(members: List[TeamMember], prompt: str) -> Optional[TeamMember]:
+    """Let the user pick one of the given members by number"""
+    print(prompt)
+    for i, member in enumerate(members, 1):
+        print(f"{i}. {member.name}")
+    
+    try:
+        idx = int(input(f"Enter choice (1-{len(members)}): ")) - 1
+        if 0 <= idx < len(members):
+            return members[idx]
+        print("❌ Invalid choice")
+    except ValueError:
+        print("❌ Please enter a valid number")
+    return None
+
 def main():
     """Team management CLI"""
-    manager = TeamManager()
+    manager = TeamManager(verbose=True)
     
     while True:
         print("\n" + "=" * 50)
@@ -408,66 +622,27 @@ def main():
             manager.create_member_interactive()
         elif choice == '2':
             manager.list_all_members()
-        elif choice == '3':
-            members = manager.list_members()
-            if not members:
-                print("👥 No team members found")
-                continue
-            
-            print("\nSelect team member:")
-            for i, name in enumerate(members, 1):
-                print(f"{i}. {name}")
-            
-            try:
-                idx = int(input(f"Enter choice (1-{len(members)}): ")) - 1
-                if 0 <= idx < len(members):
-                    manager.show_member_details(members[idx])
-                else:
-                    print("❌ Invalid choice")
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        elif choice == '4':
-            members = manager.list_members()
+        elif choice in ('3', '4', '5'):
+            members = manager.snapshot()
             if not members:
                 print("👥 No team members found")
                 continue
             
-            print("\nSelect team member:")
-            for i, name in enumerate(members, 1):
-                print(f"{i}. {name}")
-            
-            try:
-                idx = int(input(f"Enter choice (1-{len(members)}): ")) - 1
-                if 0 <= idx < len(members):
-                    manager.add_holiday_to_member(members[idx])
-                else:
-                    print("❌ Invalid choice")
-            except ValueError:
-                print("❌ Please enter a valid number")
-        
-        elif choice == '5':
-            members = manager.list_members()
-            if not members:
-                print("👥 No team members found")
+            prompt = "\nSelect team member to delete:" if choice == '5' else "\nSelect team member:"
+            member = _select_member(list(members.values()), prompt)
+            if not member:
                 continue
             
-            print("\nSelect team member to delete:")
-            for i, name in enumerate(members, 1):
-                print(f"{i}. {name}")
-            
-            try:
-                idx = int(input(f"Enter choice (1-{len(members)}): ")) - 1
-                if 0 <= idx < len(members):
-                    confirm = input(f"⚠️  Really delete '{members[idx]}'? (y/N): ").strip().lower()
-                    if confirm == 'y':
-                        manager.delete_member(members[idx])
-                    else:
-                        print("❌ Cancelled")
+            if choice == '3':
+                manager.show_member_details_obj(member)
+            elif choice == '4':
+                manager.add_holiday_to_member_obj(member)
+            else:
+                confirm = input(f"⚠️  Really delete '{member.name}'? (y/N): ").strip().lower()
+                if confirm == 'y':
+                    manager.delete_member_by_obj(member)
                 else:
-                    print("❌ Invalid choice")
-            except ValueError:
-                print("❌ Please enter a valid number")
+                    print("❌ Cancelled")
         
         else:
             print("❌ Invalid choice")
@@ -2,67 +2,151 @@
 Pytest configuration and fixtures for Jira Spec Sheet Sync tests
 """
 import pytest
+import copy
 import os
-import tempfile
-import shutil
+import re
+from collections import defaultdict
+from functools import lru_cache
+from io import BytesIO
+from types import MappingProxyType, SimpleNamespace
 from unittest.mock import Mock, patch
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 import openpyxl
 
+from utils.config import JiraConfig
+from utils.jira_client import JiraClient
 from tests.test_data import (
     MOCK_EPICS, MOCK_STORIES, MOCK_VERSIONS, MOCK_FIELDS, TEST_CONFIG,
     get_mock_stories_for_epic, get_mock_epic_by_key
 )
 
+# Test doubles
+
+class RecordingStub:
+    """Lightweight stand-in for Mock that records (args, kwargs) of each call"""
+    __slots__ = ("calls", "response", "side_effect")
+    
+    def __init__(self, response=None, side_effect=None):
+        self.calls = []
+        self.response = response
+        self.side_effect = side_effect
+    
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect:
+            return self.side_effect(*args, **kwargs)
+        return self.response
+
+class FakeWorksheet:
+    """Minimal worksheet stand-in: cells are created on first access and kept by (row, column)"""
+    
+    def __init__(self):
+        self.cells = {}
+        self.column_dimensions = defaultdict(SimpleNamespace)
+        self.row_dimensions = defaultdict(SimpleNamespace)
+    
+    @property
+    def max_row(self):
+        return max((row for row, _ in self.cells), default=1)
+    
+    def cell(self, row, column):
+        cell = self.cells.get((row, column))
+        if cell is None:
+            cell = self.cells[(row, column)] = SimpleNamespace(value=None)
+        return cell
+    
+    def delete_rows(self, idx, amount=1):
+        self.cells = {key: cell for key, cell in self.cells.items() if not idx <= key[0] < idx + amount}
+    
+    def values(self):
+        """All non-empty cell values, in row then column order"""
+        return [self.cells[key].value for key in sorted(self.cells) if self.cells[key].value is not None]
+
+class FakeWorkbook:
+    """Minimal workbook stand-in with one FakeWorksheet per sheet name"""
+    
+    def __init__(self, sheetnames):
+        self.sheetnames = list(sheetnames)
+        self.sheets = {name: FakeWorksheet() for name in self.sheetnames}
+        self.saved = False
+    
+    def __getitem__(self, name):
+        return self.sheets[name]
+    
+    def save(self, *args, **kwargs):
+        self.saved = True
+
 # Test fixtures
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files"""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+def _set_test_env(mp: pytest.MonkeyPatch):
+    """Point the Jira settings at TEST_CONFIG"""
+    for key, value in TEST_CONFIG.items():
+        mp.setenv(key, value)
 
 @pytest.fixture
-def test_config():
+def test_config(monkeypatch):
     """Mock configuration for testing"""
-    with patch.dict(os.environ, TEST_CONFIG):
-        from utils.config import JiraConfig
-        yield JiraConfig()
+    _set_test_env(monkeypatch)
+    return JiraConfig()
+
+@pytest.fixture(scope="session")
+def jira_config():
+    """JiraConfig built once per session from TEST_CONFIG (it only reads the environment on init)"""
+    with pytest.MonkeyPatch.context() as mp:
+        _set_test_env(mp)
+        return JiraConfig()
+
+@pytest.fixture
+def jira_client(jira_config):
+    """(config, client) pair; the client is fresh per test since tests replace its methods"""
+    return jira_config, JiraClient(jira_config)
+
+@pytest.fixture
+def http_response():
+    """Factory for generic successful HTTP response mocks returning the given JSON"""
+    def make_response(json_value=None):
+        response = Mock()
+        response.json.return_value = json_value
+        response.raise_for_status.return_value = None
+        return response
+    return make_response
 
 @pytest.fixture
 def mock_jira_client(test_config):
     """Mock JIRA client with test data"""
-    from utils.jira_client import JiraClient
-    
     client = JiraClient(test_config)
     
-    # Mock the API requests
-    client.get_epics = Mock(return_value=MOCK_EPICS)
-    client.get_stories_for_epic = Mock(side_effect=get_mock_stories_for_epic)
-    client.get_story_points = Mock(side_effect=lambda story: story["fields"].get("customfield_10016", 0))
-    client.get_project_versions = Mock(return_value=MOCK_VERSIONS["values"])
-    client.get_available_versions = Mock(return_value=["v3", "v2"])
-    client.get_version_details = Mock(side_effect=lambda name: next(
+    # Stub the API requests with plain callables; no test inspects their calls
+    client.get_epics = lambda *args, **kwargs: MOCK_EPICS
+    client.get_stories_for_epic = get_mock_stories_for_epic
+    client.get_story_points = lambda story: story["fields"].get("customfield_10016", 0)
+    client.get_project_versions = lambda *args, **kwargs: MOCK_VERSIONS["values"]
+    client.get_available_versions = lambda *args, **kwargs: ["v3", "v2"]
+    client.get_version_details = lambda name: next(
         (v for v in MOCK_VERSIONS["values"] if v["name"] == name), None
-    ))
-    client.test_connection = Mock(return_value=True)
-    client._make_request = Mock(side_effect=_mock_api_request)
+    )
+    client.test_connection = lambda: True
+    client._make_request = _mock_api_request
     
     return client
 
+# Search responses built once; stories are looked up by the first issue key in the JQL
+_EPIC_SEARCH_RESPONSE = {"issues": MOCK_EPICS}
+_STORY_SEARCH_RESPONSES = {epic_key: {"issues": stories} for epic_key, stories in MOCK_STORIES.items()}
+_ISSUE_KEY_RE = re.compile(r'\b([A-Z][A-Z0-9]*-\d+)\b')
+
 def _mock_api_request(endpoint: str, params: Dict = None) -> Dict:
     """Mock API request handler"""
     if 'search' in endpoint:
         # Mock JQL search
         jql = params.get('jql', '') if params else ''
         if 'issuetype = Epic' in jql:
-            return {"issues": MOCK_EPICS}
+            return _EPIC_SEARCH_RESPONSE
         else:
             # Return stories based on epic key in JQL
-            for epic_key in MOCK_STORIES.keys():
-                if epic_key in jql:
-                    return {"issues": MOCK_STORIES[epic_key]}
+            match = _ISSUE_KEY_RE.search(jql)
+            if match and match.group(1) in _STORY_SEARCH_RESPONSES:
+                return _STORY_SEARCH_RESPONSES[match.group(1)]
             return {"issues": []}
     
     elif 'version' in endpoint:
@@ -76,84 +160,61 @@ def _mock_api_request(endpoint: str, params: Dict = None) -> Dict:
     
     return {}
 
-@pytest.fixture
-def test_workbook(temp_dir):
-    """Create a test Excel workbook"""
-    wb = openpyxl.Workbook()
+@pytest.fixture(scope="session")
+def _base_workbook_bytes():
+    """Build the test Excel workbook once per session, as xlsx bytes"""
+    # Rows are streamed with append(); write-only mode skips the per-cell object cache
+    wb = openpyxl.Workbook(write_only=True)
     
     # Create Scope sheet
-    scope_ws = wb.active
-    scope_ws.title = "Scope (Quantity)"
+    scope_ws = wb.create_sheet("Scope (Quantity)")
     
     # Add basic headers
-    headers = [
+    scope_ws.append([
         "Item", "MoSCoW", "Risk Profile", "Details", 
         "SP (Proven)", "Fixed Price", "SP (Experimental)", 
         "Min Price", "Max Price", "SP (Dependant)", "Hourly Estimate"
-    ]
-    for col, header in enumerate(headers, 1):
-        scope_ws.cell(row=1, column=col, value=header)
+    ])
     
     # Create Definition of Done (Quality) sheet with comprehensive structure
     dod_ws = wb.create_sheet("Definition of Done (Quality)")
     
     # Add headers
-    headers = ["Definition of Done", "MoSCoW", "Price Impact", "Price Impact %"]
-    for col, header in enumerate(headers, 1):
-        dod_ws.cell(row=1, column=col, value=header)
-    
-    # Add comprehensive DoD data
-    row_num = 2
+    dod_rows = [["Definition of Done", "MoSCoW", "Price Impact", "Price Impact %"]]
     
     # Code quality & documentation
-    dod_ws.cell(row=row_num, column=1, value="Code quality & documentation")
-    row_num += 1
-    code_quality_items = [
-        ("Code is structured, modular, and follows best practices", "Must Have", "8", 0.04),
-        ("Code is reviewed and approved via pull requests", "Must Have", "5", 0.03),
-        ("Code is covered with relevant unit and integration tests", "Won't Have", "13", 0.0),
-        ("Code is well-documented (inline comments, README, API docs)", "Could Have", "8", 0.04),
-    ]
-    for desc, moscow, impact_desc, impact_pct in code_quality_items:
-        for col, value in enumerate([desc, moscow, impact_desc, impact_pct], 1):
-            dod_ws.cell(row=row_num, column=col, value=value)
-        row_num += 1
-    row_num += 1  # Empty row
+    dod_rows.append(["Code quality & documentation"])
+    dod_rows.extend([
+        ["Code is structured, modular, and follows best practices", "Must Have", "8", 0.04],
+        ["Code is reviewed and approved via pull requests", "Must Have", "5", 0.03],
+        ["Code is covered with relevant unit and integration tests", "Won't Have", "13", 0.0],
+        ["Code is well-documented (inline comments, README, API docs)", "Could Have", "8", 0.04],
+    ])
+    dod_rows.append([])  # Empty row
     
     # Performance & optimization
-    dod_ws.cell(row=row_num, column=1, value="Performance & optimization")
-    row_num += 1
-    performance_items = [
-        ("API calls are debounced to increase performance", "Must Have", "5", 0.03),
-        ("Widget rendering is smooth with minimal performance impact", "Must Have", "13", 0.07),
-        ("State management is efficient and avoids unnecessary re-renders", "Must Have", "8", 0.04),
-    ]
-    for desc, moscow, impact_desc, impact_pct in performance_items:
-        for col, value in enumerate([desc, moscow, impact_desc, impact_pct], 1):
-            dod_ws.cell(row=row_num, column=col, value=value)
-        row_num += 1
-    row_num += 1  # Empty row
+    dod_rows.append(["Performance & optimization"])
+    dod_rows.extend([
+        ["API calls are debounced to increase performance", "Must Have", "5", 0.03],
+        ["Widget rendering is smooth with minimal performance impact", "Must Have", "13", 0.07],
+        ["State management is efficient and avoids unnecessary re-renders", "Must Have", "8", 0.04],
+    ])
+    dod_rows.append([])  # Empty row
     
     # Security & deployment (shortened for test)
-    dod_ws.cell(row=row_num, column=1, value="Security & deployment")
-    row_num += 1
-    security_items = [
-        ("Security vulnerabilities are identified and mitigated", "Must Have", "8", 0.04),
-        ("Features are tested in multiple browsers and mobile devices", "Must Have", "13", 0.07),
-    ]
-    for desc, moscow, impact_desc, impact_pct in security_items:
-        for col, value in enumerate([desc, moscow, impact_desc, impact_pct], 1):
-            dod_ws.cell(row=row_num, column=col, value=value)
-        row_num += 1
-    row_num += 1  # Empty row
+    dod_rows.append(["Security & deployment"])
+    dod_rows.extend([
+        ["Security vulnerabilities are identified and mitigated", "Must Have", "8", 0.04],
+        ["Features are tested in multiple browsers and mobile devices", "Must Have", "13", 0.07],
+    ])
+    dod_rows.extend([[], []])  # Empty rows
     
     # Sum row - calculate from actual values
-    row_num += 1
-    dod_ws.cell(row=row_num, column=3, value="Sum")
-    
-    # Calculate sum from the test DoD items
     test_sum = 0.04 + 0.03 + 0.0 + 0.04 + 0.03 + 0.07 + 0.04 + 0.04 + 0.07  # Sum of all impact percentages above
-    dod_ws.cell(row=row_num, column=4, value=test_sum)
+    dod_rows.append([None, None, "Sum", test_sum])
+    
+    for row in dod_rows:
+        dod_ws.append(row)
     
     # Create Settings sheet
     settings_ws = wb.create_sheet("Settings")
@@ -164,18 +225,36 @@ def test_workbook(temp_dir):
         ["Hourly Rate", 95.37],
         ["DoD Impact Total", 0.63]
     ]
-    for row, data in enumerate(settings_data, 1):
-        for col, value in enumerate(data, 1):
-            settings_ws.cell(row=row, column=col, value=value)
+    for row in settings_data:
+        settings_ws.append(row)
     
-    # Save workbook
-    test_file = os.path.join(temp_dir, "test-spec-sheet.xlsx")
-    wb.save(test_file)
-    
-    return test_file
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+@pytest.fixture
+def test_workbook(tmp_path, _base_workbook_bytes):
+    """Create a test Excel workbook (a fresh copy per test, safe to modify)"""
+    test_file = tmp_path / "test-spec-sheet.xlsx"
+    test_file.write_bytes(_base_workbook_bytes)
+    return str(test_file)
+
+@pytest.fixture(scope="session")
+def shared_workbook(tmp_path_factory, _base_workbook_bytes):
+    """Test Excel workbook written once per session, for tests that only read it"""
+    test_file = tmp_path_factory.mktemp("workbook") / "test-spec-sheet.xlsx"
+    test_file.write_bytes(_base_workbook_bytes)
+    return str(test_file)
+
+@pytest.fixture(scope="module")
+def loaded_workbook(shared_workbook):
+    """Shared workbook opened read-only once per module"""
+    wb = openpyxl.load_workbook(shared_workbook, read_only=True, data_only=True)
+    yield wb
+    wb.close()
 
 @pytest.fixture
-def mock_spec_sheet_sync(mock_jira_client, test_workbook, temp_dir):
+def mock_spec_sheet_sync(mock_jira_client, test_workbook):
     """Mock EnhancedSpecSheetSync instance for testing"""
     # Patch the classes at their correct import locations in the refactored code
     with patch('utils.jira_client.JiraClient') as mock_client_class:
@@ -184,11 +263,6 @@ def mock_spec_sheet_sync(mock_jira_client, test_workbook, temp_dir):
             mock_config_class.return_value = mock_jira_client.config
             
             # Import after patching
-            import sys
-            project_root = os.path.dirname(os.path.dirname(__file__))
-            if project_root not in sys.path:
-                sys.path.insert(0, project_root)
-            
             from spec_sheet.spec_sheet_generator import EnhancedSpecSheetSync
             
             # Create instance
@@ -197,57 +271,94 @@ def mock_spec_sheet_sync(mock_jira_client, test_workbook, temp_dir):
             
             yield sync
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def spec_sheet_classes():
     """Import spec sheet generator classes from the new modular structure"""
-    import sys
-    import os
-    
-    # Add the project root to Python path for imports
-    project_root = os.path.dirname(os.path.dirname(__file__))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-    
+    # The project root is on sys.path via pytest.ini's pythonpath
     # Import from the new modular locations
     from team.team_manager import TeamMember
     from spec_sheet.sprint.sprint_planner import Team
     from spec_sheet.spec_sheet_generator import EnhancedSpecSheetSync
     
-    return {
+    return MappingProxyType({
         'TeamMember': TeamMember,
         'Team': Team,
         'EnhancedSpecSheetSync': EnhancedSpecSheetSync
-    }
+    })
+
+@pytest.fixture(scope="module")
+def spec_sheet_sync(spec_sheet_classes):
+    """EnhancedSpecSheetSync built once per module, for tests that only query its components"""
+    with pytest.MonkeyPatch.context() as mp:
+        _set_test_env(mp)
+        return spec_sheet_classes['EnhancedSpecSheetSync']()
 
 @pytest.fixture
+def sync_instance(spec_sheet_sync):
+    """Shallow copy of the shared sync; attributes may be replaced, but the orchestrator is shared"""
+    return copy.copy(spec_sheet_sync)
+
+@pytest.fixture(scope="session")
 def sample_team_data():
-    """Sample team composition data for testing"""
-    return [
+    """Sample team composition data for testing (shared, read-only)"""
+    return tuple(MappingProxyType(member) for member in [
         {"role": "Senior Developer", "fte": 1.0, "story_points_per_sprint": 8, "hourly_rate": 110},
         {"role": "Junior Developer", "fte": 1.0, "story_points_per_sprint": 5, "hourly_rate": 75},
         {"role": "Designer", "fte": 0.5, "story_points_per_sprint": 6, "hourly_rate": 85}
-    ]
+    ])
+
+@pytest.fixture(scope="module")
+def sample_members(spec_sheet_classes, sample_team_data):
+    """TeamMember objects built from sample_team_data once per module"""
+    TeamMember = spec_sheet_classes['TeamMember']
+    # TeamMember(name, role, availability, story_points_per_sprint, hourly_rate)
+    return tuple(
+        TeamMember(
+            f"Member {i+1}",
+            member_data["role"],
+            member_data["fte"],
+            member_data["story_points_per_sprint"],
+            member_data["hourly_rate"]
+        )
+        for i, member_data in enumerate(sample_team_data)
+    )
+
+@pytest.fixture(scope="module")
+def built_team(spec_sheet_classes, sample_members):
+    """Team of the sample members built once per module; copy members before mutating"""
+    team = spec_sheet_classes['Team']("Development Team")
+    for member in sample_members:
+        team.add_member(member)
+    return team
 
 # Utility functions for tests
 
-def assert_workbook_has_sheet(workbook_path: str, sheet_name: str):
-    """Assert that workbook contains the specified sheet"""
-    wb = openpyxl.load_workbook(workbook_path)
-    assert sheet_name in wb.sheetnames, f"Sheet '{sheet_name}' not found in workbook"
+def assert_workbook_has_sheets(workbook_path: str, sheet_names: Iterable[str]):
+    """Assert that workbook contains all of the specified sheets (opens the file once)"""
+    wb = openpyxl.load_workbook(workbook_path, read_only=True)
+    sheetnames = set(wb.sheetnames)
+    wb.close()
+    missing = set(sheet_names) - sheetnames
+    assert not missing, f"Sheets {sorted(missing)} not found in workbook"
 
-def get_sheet_data(workbook_path: str, sheet_name: str) -> List[List]:
-    """Get all data from a worksheet"""
-    wb = openpyxl.load_workbook(workbook_path)
-    ws = wb[sheet_name]
-    
-    data = []
-    for row in ws.iter_rows(values_only=True):
-        if any(cell is not None for cell in row):  # Skip empty rows
-            data.append(list(row))
-    
-    return data
+@lru_cache(maxsize=16)
+def _load_sheet_rows(workbook_path: str, mtime_ns: int, sheet_name: str,
+                     max_rows: Optional[int] = None) -> Tuple[Tuple, ...]:
+    """Read the non-empty rows of a worksheet; the mtime in the key drops stale entries"""
+    wb = openpyxl.load_workbook(workbook_path, read_only=True, data_only=True)
+    try:
+        return tuple(
+            row for row in wb[sheet_name].iter_rows(max_row=max_rows, values_only=True)
+            if any(cell is not None for cell in row)  # Skip empty rows
+        )
+    finally:
+        wb.close()
+
+def get_sheet_data(workbook_path: str, sheet_name: str, max_rows: Optional[int] = None) -> List[List]:
+    """Get all data from a worksheet, or only from its first max_rows rows"""
+    rows = _load_sheet_rows(workbook_path, os.stat(workbook_path).st_mtime_ns, sheet_name, max_rows)
+    return [list(row) for row in rows]
 
 def count_non_empty_rows(workbook_path: str, sheet_name: str) -> int:
     """Count non-empty rows in a sheet"""
-    data = get_sheet_data(workbook_path, sheet_name)
-    return len([row for row in data if any(cell is not None for cell in row)]) 
\ No newline at end of file
+    return len(_load_sheet_rows(workbook_path, os.stat(workbook_path).st_mtime_ns, sheet_name))
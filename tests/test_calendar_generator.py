@@ -0,0 +1,101 @@
+"""
+Unit tests for the calendar view sheet
+"""
+import calendar
+import openpyxl
+import pytest
+from datetime import date
+
+from timeline.calendar_generator import CalendarGenerator, _month_matrix
+from timeline.holiday_manager import HolidayInfo, HolidayManager
+from timeline.sprint_models import Sprint
+
+SPRINT_COLOR = "00E6F3FF"
+HOLIDAY_COLOR = "00FFE6E6"
+WEEKEND_COLOR = "00F5F5F5"
+
+
+def _day_colors(ws):
+    """Map each (row, day) cell of the calendar grid to its fill color"""
+    colors = {}
+    for row in ws.iter_rows(min_row=5, max_col=7):
+        for cell in row:
+            if isinstance(cell.value, int):
+                colors[(cell.row, cell.value)] = cell.fill.fgColor.rgb if cell.fill.fill_type else None
+    return colors
+
+
+@pytest.mark.parametrize("year,month", [(2025, 2), (2025, 6), (2026, 2), (2024, 12)])
+def test_month_matrix_matches_monthcalendar(year, month):
+    """Test that cached month layouts line up with calendar.monthcalendar"""
+    weeks = _month_matrix(year, month)
+
+    assert [[day or 0 for day in week] for week in weeks] == calendar.monthcalendar(year, month)
+
+
+class TestCalendarView:
+    """Test day colouring in the monthly calendar view"""
+
+    @pytest.fixture
+    def holiday_manager(self):
+        manager = HolidayManager()
+        manager.holidays.extend([
+            HolidayInfo(date(2025, 4, 21), "Tweede Paasdag"),
+            HolidayInfo(date(2025, 5, 5), "Bevrijdingsdag"),
+            HolidayInfo(date(2025, 5, 7), "Personal Day Off", is_national=False, affected_members=["Alice"]),
+        ])
+        return manager
+
+    @pytest.fixture
+    def sprints(self):
+        return [
+            Sprint(1, date(2025, 3, 24), date(2025, 4, 4), 10.0),  # Starts before the first month shown
+            Sprint(2, date(2025, 4, 28), date(2025, 5, 9), 10.0),  # Crosses a month boundary
+            Sprint(3, date(2025, 5, 26), date(2025, 6, 6), 10.0),  # Ends after the last month shown
+        ]
+
+    def test_day_colors(self, holiday_manager, sprints):
+        """Test that holidays beat sprint days, which beat weekends"""
+        wb = openpyxl.Workbook()
+        CalendarGenerator(holiday_manager, sprints).create_calendar_view_sheet(
+            wb, date(2025, 4, 2), date(2025, 5, 20))
+        colors = _day_colors(wb["Calendar View"])
+
+        by_day = {}
+        for (row, day), color in sorted(colors.items()):
+            month = 4 if row < 14 else 5  # April fills rows 5-13, May starts at 14
+            by_day[date(2025, month, day)] = color
+        assert len(by_day) == 61
+
+        for day, color in by_day.items():
+            if day in (date(2025, 4, 21), date(2025, 5, 5)):
+                expected = HOLIDAY_COLOR
+            elif any(s.start_date <= day <= s.end_date for s in sprints):
+                expected = SPRINT_COLOR
+            elif day.weekday() >= 5:
+                expected = WEEKEND_COLOR
+            else:
+                expected = None
+            assert color == expected, day
+
+    def test_missing_project_dates(self, holiday_manager):
+        """Test the placeholder sheet when no timeline has been generated"""
+        wb = openpyxl.Workbook()
+        CalendarGenerator(holiday_manager, []).create_calendar_view_sheet(wb, None, None)
+
+        assert wb["Calendar View"].cell(row=1, column=1).value == "No project timeline generated yet"
+
+    def test_days_use_named_styles(self, holiday_manager, sprints):
+        """Test that day cells share the calendar named styles, registered once per workbook"""
+        wb = openpyxl.Workbook()
+        generator = CalendarGenerator(holiday_manager, sprints)
+        generator.create_calendar_view_sheet(wb, date(2025, 5, 1), date(2025, 5, 31))
+        generator.create_calendar_view_sheet(wb, date(2025, 5, 1), date(2025, 5, 31))
+
+        assert wb.named_styles.count("Calendar Sprint") == 1
+        styles = {cell.value: cell.style for row in wb["Calendar View1"].iter_rows(min_row=7, max_col=7)
+                  for cell in row if isinstance(cell.value, int)}
+        assert styles[5] == "Calendar Holiday"
+        assert styles[6] == "Calendar Sprint"
+        assert styles[10] == "Calendar Weekend"
+        assert styles[14] == "Calendar Day"
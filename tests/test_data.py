@@ -1,135 +1,94 @@
 """
 Test data and fixtures for Jira Spec Sheet Sync tests
 """
-from typing import Dict, List
+from itertools import chain
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Tuple
 
-# Mock JIRA Epic data
-MOCK_EPICS = [
-    {
-        "key": "PROJ-100",
-        "fields": {
-            "summary": "User Authentication System",
-            "description": "Implement complete user authentication system with OAuth2 support",
-            "status": {"name": "In Progress"},
-            "fixVersions": [{"name": "v3"}]
-        }
-    },
-    {
-        "key": "PROJ-200", 
-        "fields": {
-            "summary": "Payment Integration",
-            "description": "Integrate Stripe payment processing",
-            "status": {"name": "To Do"},
-            "fixVersions": [{"name": "v3"}]
-        }
-    },
-    {
-        "key": "PROJ-300",
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+# Mock JIRA data is frozen: tests share it, so any accidental mutation raises TypeError
+
+def make_mock_epic(key: str, summary: str, description: str, status: str = "To Do",
+                   version: str = "v3") -> Dict:
+    """Build a mock Jira epic issue"""
+    return {
+        "key": key,
         "fields": {
-            "summary": "Analytics Dashboard",
-            "description": "Create comprehensive analytics dashboard",
-            "status": {"name": "To Do"},
-            "fixVersions": [{"name": "v3"}]
+            "summary": summary,
+            "description": description,
+            "status": {"name": status},
+            "fixVersions": [{"name": version}]
         }
     }
-]
 
-# Mock JIRA Story data
-MOCK_STORIES = {
-    "PROJ-100": [  # Stories for User Authentication Epic
-        {
-            "key": "PROJ-101",
-            "fields": {
-                "summary": "Design login page UI",
-                "description": "Create wireframes and mockups for login page",
-                "status": {"name": "Done"},
-                "labels": ["frontend", "design"],
-                "priority": {"name": "High"},
-                "customfield_10016": 3.0,  # Story points
-                "customfield_10273": "proven"  # Type of work
-            }
-        },
-        {
-            "key": "PROJ-102", 
-            "fields": {
-                "summary": "Implement OAuth2 authentication",
-                "description": "Integrate OAuth2 with Google and GitHub providers",
-                "status": {"name": "In Progress"},
-                "labels": ["backend", "security"],
-                "priority": {"name": "High"},
-                "customfield_10016": 8.0,  # Story points
-                "customfield_10273": "experimental"  # Type of work
-            }
-        },
-        {
-            "key": "PROJ-103",
-            "fields": {
-                "summary": "Set up user session management",
-                "description": "Implement secure session management with Redis",
-                "status": {"name": "To Do"},
-                "labels": ["backend", "security"],
-                "priority": {"name": "Medium"},
-                "customfield_10016": 5.0,  # Story points
-                "customfield_10273": "dependant"  # Type of work
-            }
-        }
-    ],
-    "PROJ-200": [  # Stories for Payment Integration Epic
-        {
-            "key": "PROJ-201",
-            "fields": {
-                "summary": "Research payment gateway options",
-                "description": "Compare Stripe, PayPal, and other payment options",
-                "status": {"name": "Done"},
-                "labels": ["research"],
-                "priority": {"name": "High"},
-                "customfield_10016": 2.0,  # Story points
-                "customfield_10273": "proven"  # Type of work
-            }
-        },
-        {
-            "key": "PROJ-202",
-            "fields": {
-                "summary": "Implement Stripe payment processing",
-                "description": "Set up Stripe SDK and payment flow",
-                "status": {"name": "To Do"},
-                "labels": ["backend", "payment"],
-                "priority": {"name": "High"},
-                "customfield_10016": 13.0,  # Story points
-                "customfield_10273": "experimental"  # Type of work
-            }
-        }
-    ],
-    "PROJ-300": [  # Stories for Analytics Dashboard Epic
-        {
-            "key": "PROJ-301",
-            "fields": {
-                "summary": "Design dashboard layout",
-                "description": "Create dashboard wireframes and user flow",
-                "status": {"name": "To Do"},
-                "labels": ["frontend", "design"],
-                "priority": {"name": "Medium"},
-                "customfield_10016": 5.0,  # Story points
-                "customfield_10273": "proven"  # Type of work
-            }
-        },
-        {
-            "key": "PROJ-302",
+# Mock JIRA Epic data
+MOCK_EPICS = _freeze((
+    make_mock_epic("PROJ-100", "User Authentication System",
+                   "Implement complete user authentication system with OAuth2 support", status="In Progress"),
+    make_mock_epic("PROJ-200", "Payment Integration", "Integrate Stripe payment processing"),
+    make_mock_epic("PROJ-300", "Analytics Dashboard", "Create comprehensive analytics dashboard"),
+))
+
+# Mock JIRA Story data, one compact row per story:
+# (epic, key, summary, description, status, labels, priority, story points, type of work)
+_STORY_ROWS = (
+    # Stories for User Authentication Epic
+    ("PROJ-100", "PROJ-101", "Design login page UI", "Create wireframes and mockups for login page",
+     "Done", ("frontend", "design"), "High", 3.0, "proven"),
+    ("PROJ-100", "PROJ-102", "Implement OAuth2 authentication", "Integrate OAuth2 with Google and GitHub providers",
+     "In Progress", ("backend", "security"), "High", 8.0, "experimental"),
+    ("PROJ-100", "PROJ-103", "Set up user session management", "Implement secure session management with Redis",
+     "To Do", ("backend", "security"), "Medium", 5.0, "dependant"),
+    # Stories for Payment Integration Epic
+    ("PROJ-200", "PROJ-201", "Research payment gateway options", "Compare Stripe, PayPal, and other payment options",
+     "Done", ("research",), "High", 2.0, "proven"),
+    ("PROJ-200", "PROJ-202", "Implement Stripe payment processing", "Set up Stripe SDK and payment flow",
+     "To Do", ("backend", "payment"), "High", 13.0, "experimental"),
+    # Stories for Analytics Dashboard Epic
+    ("PROJ-300", "PROJ-301", "Design dashboard layout", "Create dashboard wireframes and user flow",
+     "To Do", ("frontend", "design"), "Medium", 5.0, "proven"),
+    ("PROJ-300", "PROJ-302", "Implement real-time data visualization", "Create interactive charts using D3.js",
+     "To Do", ("frontend", "dataviz"), "Low", 8.0, "dependant"),
+)
+
+def _build_stories(rows) -> Dict[str, List[Dict]]:
+    """Expand story rows into Jira issue dicts grouped by epic key"""
+    stories = {}
+    for epic_key, key, summary, description, status, labels, priority, points, work_type in rows:
+        stories.setdefault(epic_key, []).append({
+            "key": key,
             "fields": {
-                "summary": "Implement real-time data visualization",
-                "description": "Create interactive charts using D3.js",
-                "status": {"name": "To Do"},
-                "labels": ["frontend", "dataviz"],
-                "priority": {"name": "Low"},
-                "customfield_10016": 8.0,  # Story points
-                "customfield_10273": "dependant"  # Type of work
+                "summary": summary,
+                "description": description,
+                "status": {"name": status},
+                "labels": labels,
+                "priority": {"name": priority},
+                "customfield_10016": points,  # Story points
+                "customfield_10273": work_type  # Type of work
             }
-        }
-    ]
+        })
+    return stories
+
+MOCK_STORIES = _freeze(_build_stories(_STORY_ROWS))
+
+# Canned search responses keyed by a JQL fragment, checked in order
+MOCK_SEARCH_RESPONSES = {
+    'fixVersion = "v3"': {"issues": tuple(
+        epic for epic in MOCK_EPICS
+        if any(v.get("name") == "v3" for v in epic["fields"].get("fixVersions", []))
+    )},
+    **{epic_key: {"issues": stories} for epic_key, stories in MOCK_STORIES.items()},
 }
 
 # Mock project versions
-MOCK_VERSIONS = {
+MOCK_VERSIONS = _freeze({
     "values": [
         {
             "id": "10047",
@@ -148,7 +107,7 @@ MOCK_VERSIONS = {
             "releaseDate": "2024-01-15"
         }
     ]
-}
+})
 
 # Mock JIRA field definitions
 MOCK_FIELDS = [
@@ -176,28 +135,28 @@ TEST_CONFIG = {
     "JIRA_TYPE_OF_WORK_FIELD": "customfield_10273"
 }
 
+_EPIC_BY_KEY = MappingProxyType({epic["key"]: epic for epic in MOCK_EPICS})
+
 def get_mock_epic_by_key(epic_key: str) -> Dict:
     """Get mock epic by key"""
-    for epic in MOCK_EPICS:
-        if epic["key"] == epic_key:
-            return epic
-    return None
+    return _EPIC_BY_KEY.get(epic_key)
+
+def get_mock_search_response(jql: str, default: Dict = None) -> Dict:
+    """Get the canned search response for a JQL query (default, or no issues, if none matches)"""
+    for fragment, response in MOCK_SEARCH_RESPONSES.items():
+        if fragment in jql:
+            return response
+    return default if default is not None else {"issues": ()}
 
 def get_mock_stories_for_epic(epic_key: str) -> List[Dict]:
     """Get mock stories for an epic"""
-    return MOCK_STORIES.get(epic_key, [])
+    return MOCK_STORIES.get(epic_key, ())
 
 def get_total_story_points() -> float:
-    """Calculate total story points across all mock data"""
-    total = 0
-    for stories in MOCK_STORIES.values():
-        for story in stories:
-            sp = story["fields"].get("customfield_10016", 0)
-            if sp:
-                total += sp
-    return total
+    """Total story points across all mock data"""
+    return TOTAL_STORY_POINTS
 
-def get_stories_by_risk_profile() -> Dict[str, List[Dict]]:
+def _group_stories_by_risk_profile() -> Mapping[str, Tuple[Dict, ...]]:
     """Group mock stories by risk profile"""
     profiles = {"proven": [], "experimental": [], "dependant": []}
     
@@ -207,4 +166,19 @@ def get_stories_by_risk_profile() -> Dict[str, List[Dict]]:
             if risk_profile in profiles:
                 profiles[risk_profile].append(story)
     
-    return profiles 
\ No newline at end of file
+    return MappingProxyType({profile: tuple(stories) for profile, stories in profiles.items()})
+
+# Computed once at import; the mock data is static
+STORIES_BY_RISK_PROFILE = _group_stories_by_risk_profile()
+TOTAL_STORY_POINTS = sum(
+    sp for stories in MOCK_STORIES.values() for story in stories
+    for sp in (story["fields"].get("customfield_10016"),) if sp
+)
+ALL_RISK_PROFILES = frozenset(
+    story["fields"].get("customfield_10273", "proven")
+    for story in chain.from_iterable(MOCK_STORIES.values())
+)
+
+def get_stories_by_risk_profile() -> Mapping[str, Tuple[Dict, ...]]:
+    """Group mock stories by risk profile (shared, read-only)"""
+    return STORIES_BY_RISK_PROFILE
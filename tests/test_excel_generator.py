@@ -0,0 +1,80 @@
+"""
+Unit tests for the timeline workbook
+"""
+import openpyxl
+import pytest
+from datetime import date
+
+from team.team_manager import TeamMember
+from timeline.calendar_generator import CalendarGenerator
+from timeline.excel_generator import ExcelGenerator
+from timeline.holiday_manager import HolidayInfo, HolidayManager
+from timeline.sprint_models import Sprint
+
+
+@pytest.fixture
+def timeline_workbook(tmp_path):
+    """Write a small timeline workbook and open it again"""
+    alice = TeamMember("Alice Johnson", "Developer", hourly_rate=85.0)
+    alice.add_holiday("2025-05-02", "2025-05-02", "Day Off")
+    holiday_manager = HolidayManager()
+    holiday_manager.holidays.extend([
+        HolidayInfo(date(2025, 5, 5), "Bevrijdingsdag"),
+        HolidayInfo(date(2025, 5, 2), "Day Off", is_national=False, affected_members=["Alice Johnson"]),
+    ])
+    sprints = [
+        Sprint(1, date(2025, 4, 28), date(2025, 5, 9), 8.0, team_velocity=10.0),
+        Sprint(2, date(2025, 5, 12), date(2025, 5, 23), 5.0, team_velocity=10.0),
+    ]
+    generator = ExcelGenerator([alice], sprints, holiday_manager,
+                               CalendarGenerator(holiday_manager, sprints),
+                               date(2025, 4, 28), date(2025, 5, 23))
+
+    filename = generator.create_timeline_workbook(str(tmp_path / "timeline.xlsx"))
+
+    return openpyxl.load_workbook(filename)
+
+
+class TestTimelineWorkbook:
+    """Test the streamed timeline workbook"""
+
+    def test_sheets(self, timeline_workbook):
+        """Test that every sheet is written in order"""
+        assert timeline_workbook.sheetnames == ["Team Members", "Holidays", "Sprint Timeline", "Calendar View"]
+
+    def test_headers_and_widths(self, timeline_workbook):
+        """Test header styling and that columns are sized to their contents"""
+        ws = timeline_workbook["Holidays"]
+
+        assert [c.value for c in ws[1]] == ["Date", "Name", "Type", "Affected Members"]
+        assert ws["A1"].font.b and ws["A1"].fill.fgColor.rgb == "004F81BD"
+        assert ws.column_dimensions["A"].width == 12
+        assert ws.column_dimensions["D"].width == 18
+
+    def test_rows(self, timeline_workbook):
+        """Test member, holiday and sprint rows"""
+        assert [c.value for c in timeline_workbook["Team Members"][2]] == [
+            "Alice Johnson", "Developer", "100%", 6, "€85.00", None, 1]
+        assert [[c.value for c in row] for row in timeline_workbook["Holidays"].iter_rows(min_row=2)] == [
+            ["2025-05-02", "Day Off", "Personal", "Alice Johnson"],
+            ["2025-05-05", "Bevrijdingsdag", "National", "Everyone"],
+        ]
+
+        ws = timeline_workbook["Sprint Timeline"]
+        assert [c.value for c in ws[2]] == ["Sprint 1", "2025-04-28", "2025-05-09", 8, 10, 12, "80.0%"]
+        assert ws.max_row == 5
+        assert [c.value for c in ws[5]][:6] == ["TOTAL", None, None, 13, None, 26]
+        assert ws["A5"].font.b
+
+    def test_calendar(self, timeline_workbook):
+        """Test that the calendar keeps its layout and day styles when streamed"""
+        ws = timeline_workbook["Calendar View"]
+
+        assert ws["A1"].value == "Project Calendar: 2025-04-28 to 2025-05-23"
+        assert [ws.cell(row=5, column=1).value, ws.cell(row=14, column=1).value] == ["April 2025", "May 2025"]
+        assert ws.column_dimensions["G"].width == 6
+        may = {c.value: c.style for row in ws.iter_rows(min_row=16, max_col=7) for c in row if c.value}
+        assert may[5] == "Calendar Holiday"
+        assert may[2] == "Calendar Sprint"
+        assert may[31] == "Calendar Weekend"
+        assert may[26] == "Calendar Day"
@@ -0,0 +1,152 @@
+"""
+Unit tests for Dutch holiday fetching and caching
+"""
+import json
+import pytest
+import requests
+from datetime import date
+
+from team.team_manager import TeamMember
+from timeline.holiday_manager import DutchHolidayAPI, HolidayInfo, HolidayManager
+
+API_RESPONSE = [
+    {"date": "2025-01-01", "name": "New Year's Day"},
+    {"date": "2025-04-27", "name": "King's Day"},
+]
+
+
+@pytest.fixture(autouse=True)
+def holiday_cache(tmp_path, monkeypatch):
+    """Point the holiday cache at a temp folder and start with an empty in-process cache"""
+    monkeypatch.setattr(DutchHolidayAPI, "cache_dir", str(tmp_path / "cache"))
+    DutchHolidayAPI.clear_cache()
+    yield tmp_path / "cache"
+    DutchHolidayAPI.clear_cache()
+
+
+class TestDutchHolidayAPI:
+    """Test fetching holidays per year with the in-process and on-disk caches"""
+
+    @pytest.fixture
+    def mock_get(self, mocker, http_response):
+        return mocker.patch('timeline.holiday_manager.requests.Session.get', return_value=http_response(API_RESPONSE))
+
+    def test_fetch_once_per_year(self, mock_get):
+        """Test that repeated lookups for a year hit the API once"""
+        first = DutchHolidayAPI.fetch_holidays(2025)
+        second = DutchHolidayAPI.fetch_holidays(2025)
+
+        assert mock_get.call_count == 1
+        assert [(h.date, h.name) for h in first] == [(date(2025, 1, 1), "New Year's Day"),
+                                                     (date(2025, 4, 27), "King's Day")]
+        assert second == first
+        assert second[0] is not first[0]  # Callers get their own objects
+
+    def test_years_share_one_session(self, mock_get):
+        """Test that fetching several years goes through the shared keep-alive session"""
+        DutchHolidayAPI.fetch_holidays(2025)
+        DutchHolidayAPI.fetch_holidays(2026)
+
+        session = DutchHolidayAPI._get_session()
+        assert session is DutchHolidayAPI._get_session()
+        assert [c.args[0] for c in mock_get.call_args_list] == [
+            "https://date.nager.at/api/v3/PublicHolidays/2025/NL",
+            "https://date.nager.at/api/v3/PublicHolidays/2026/NL",
+        ]
+        assert session.get_adapter("https://date.nager.at").max_retries.total == 2
+
+    def test_disk_cache_survives_process_cache(self, mock_get, holiday_cache):
+        """Test that a new process reads the year from disk instead of the API"""
+        DutchHolidayAPI.fetch_holidays(2025)
+        DutchHolidayAPI.clear_cache()
+
+        holidays = DutchHolidayAPI.fetch_holidays(2025)
+
+        assert mock_get.call_count == 1
+        assert [h.name for h in holidays] == ["New Year's Day", "King's Day"]
+        assert sorted(p.name for p in holiday_cache.iterdir()) == ["holidays_2025.json"]
+
+    def test_fallback_is_not_cached(self, mocker, holiday_cache):
+        """Test that offline fallback holidays are returned but not cached"""
+        mock_get = mocker.patch('timeline.holiday_manager.requests.Session.get',
+                                side_effect=requests.exceptions.ConnectionError("offline"))
+
+        DutchHolidayAPI.fetch_holidays(2025)
+        holidays = DutchHolidayAPI.fetch_holidays(2025)
+
+        assert mock_get.call_count == 2
+        assert date(2025, 12, 25) in [h.date for h in holidays]
+        assert not holiday_cache.exists()
+
+    def test_corrupt_cache_file_is_refetched(self, mock_get, holiday_cache):
+        """Test that an unreadable cache file is replaced by a fresh fetch"""
+        holiday_cache.mkdir()
+        (holiday_cache / "holidays_2025.json").write_text("{not json")
+
+        holidays = DutchHolidayAPI.fetch_holidays(2025)
+
+        assert mock_get.call_count == 1
+        assert len(holidays) == 2
+        assert json.loads((holiday_cache / "holidays_2025.json").read_text())[0] == ["2025-01-01", "New Year's Day"]
+
+
+class TestTeamHolidays:
+    """Test converting team member holidays to timeline holidays"""
+
+    def test_add_team_holidays(self):
+        """Test that every day of each member holiday is added, weekends included"""
+        alice = TeamMember("Alice Johnson", "Developer")
+        alice.add_holiday("2025-07-18", "2025-07-21", "Long Weekend")
+        alice.add_holiday("2025-12-25", "2025-12-25", "Christmas Day", True)
+        bob = TeamMember("Bob Smith", "Designer")
+        bob.add_holiday("2025-08-01", "2025-08-01", "Day Off")
+        manager = HolidayManager()
+
+        manager.add_team_holidays([alice, bob])
+
+        assert [(h.date, h.name, h.affected_members) for h in manager.holidays] == [
+            (date(2025, 7, 18), "Long Weekend", ["Alice Johnson"]),
+            (date(2025, 7, 19), "Long Weekend", ["Alice Johnson"]),
+            (date(2025, 7, 20), "Long Weekend", ["Alice Johnson"]),
+            (date(2025, 7, 21), "Long Weekend", ["Alice Johnson"]),
+            (date(2025, 12, 25), "Christmas Day", []),
+            (date(2025, 8, 1), "Day Off", ["Bob Smith"]),
+        ]
+        assert manager.holidays[4].is_national
+
+
+class TestHolidayIndex:
+    """Test that weekday holiday counts follow every change to holidays"""
+
+    WEEK = (date(2025, 5, 5), date(2025, 5, 11))
+
+    @pytest.fixture
+    def manager(self):
+        manager = HolidayManager()
+        manager.holidays.append(HolidayInfo(date(2025, 5, 5), "Bevrijdingsdag"))
+        assert manager.count_holiday_weekdays(*self.WEEK) == 1
+        return manager
+
+    def test_replace_holiday(self, manager):
+        """Test that replacing a holiday without changing the count is picked up"""
+        version = manager.version
+        manager.holidays[0] = HolidayInfo(date(2025, 5, 10), "Saturday Holiday")
+
+        assert manager.version > version
+        assert manager.count_holiday_weekdays(*self.WEEK) == 0
+
+    def test_add_one_remove_another(self, manager):
+        """Test that an add and a remove in between queries are both picked up"""
+        manager.holidays.append(HolidayInfo(date(2025, 5, 6), "Day Off", is_national=False, affected_members=["Bob"]))
+        del manager.holidays[0]
+
+        assert manager.count_holiday_weekdays(*self.WEEK) == 0
+        assert manager.count_holiday_weekdays(*self.WEEK, "Bob") == 1
+
+    def test_assign_new_list(self, manager):
+        """Test that assigning a list of the same length is picked up and still tracked"""
+        manager.holidays = [HolidayInfo(date(2025, 5, 9), "Bridge Day")]
+        assert manager.count_holiday_weekdays(*self.WEEK) == 1
+
+        manager.holidays += [HolidayInfo(date(2025, 5, 8), "Another Day")]
+        assert manager.count_holiday_weekdays(*self.WEEK) == 2
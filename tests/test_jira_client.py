@@ -2,60 +2,45 @@
 Unit tests for JIRA Client functionality
 """
 import pytest
-import os
-import sys
-from unittest.mock import Mock, patch, MagicMock
+import requests
+from unittest.mock import Mock
 
-# Add the project root to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from tests.conftest import RecordingStub
+from tests.test_data import (
+    MOCK_EPICS, MOCK_VERSIONS, MOCK_FIELDS, get_mock_search_response
+)
 
-from tests.test_data import MOCK_EPICS, MOCK_STORIES, MOCK_VERSIONS, MOCK_FIELDS, TEST_CONFIG
+ALL_EPICS_RESPONSE = {"issues": MOCK_EPICS}
 
 
 class TestJiraClient:
     """Test JiraClient functionality"""
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_jira_client_initialization(self):
+    def test_jira_client_initialization(self, jira_client):
         """Test JIRA client initialization with configuration"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         assert client.config == config
         assert client.auth == (config.email, config.api_token)
         assert "application/json" in client.headers["Accept"]
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    @patch('utils.jira_client.requests.get')
-    def test_make_request_success(self, mock_get):
+    def test_make_request_success(self, mocker, jira_client, http_response):
         """Test successful API request"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
+        mock_get = mocker.patch('utils.jira_client.requests.get')
         
         # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {"key": "value"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = http_response({"key": "value"})
         
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         result = client._make_request("test-endpoint")
         
         assert result == {"key": "value"}
         mock_get.assert_called_once()
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    @patch('utils.jira_client.requests.get')
-    def test_make_request_failure(self, mock_get):
+    def test_make_request_failure(self, mocker, jira_client):
         """Test API request failure handling"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        import requests
+        mock_get = mocker.patch('utils.jira_client.requests.get')
         
         # Mock failed response
         mock_response = Mock()
@@ -64,126 +49,75 @@ class TestJiraClient:
         mock_response.text = "Not Found"
         mock_get.return_value = mock_response
         
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         with pytest.raises(requests.exceptions.HTTPError):
             client._make_request("test-endpoint")
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_epics_no_filter(self):
+    def test_get_epics_no_filter(self, jira_client):
         """Test getting epics without version filter"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
-        # Mock the _make_request method
-        client._make_request = Mock(return_value={"issues": MOCK_EPICS})
+        # Stub the _make_request method
+        client._make_request = RecordingStub(response={"issues": MOCK_EPICS})
         
         result = client.get_epics()
         
         assert result == MOCK_EPICS
         # Verify correct JQL was used
-        client._make_request.assert_called_once()
-        call_args = client._make_request.call_args
-        assert 'search' in call_args[0][0]
-        # Fix: Access params correctly - call_args[0][1] is the params dict
-        params = call_args[0][1]  # Second element of the positional args tuple
+        assert len(client._make_request.calls) == 1
+        (endpoint, params), _ = client._make_request.calls[0]
+        assert 'search' in endpoint
         assert 'issuetype = Epic' in params['jql']
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_epics_with_version_filter(self):
+    def test_get_epics_with_version_filter(self, jira_client):
         """Test getting epics with version filter"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
-        # Mock the _make_request method
-        client._make_request = Mock(return_value={"issues": MOCK_EPICS})
+        # Stub the _make_request method
+        client._make_request = RecordingStub(response={"issues": MOCK_EPICS})
         
         result = client.get_epics("v3")
         
         assert result == MOCK_EPICS
         # Verify version filter was applied
-        client._make_request.assert_called_once()
-        call_args = client._make_request.call_args
-        # Fix: Access params correctly - call_args[0][1] is the params dict  
-        params = call_args[0][1]  # Second element of the positional args tuple
-        jql = params['jql']
-        assert 'fixVersion = "v3"' in jql
+        assert len(client._make_request.calls) == 1
+        (_, params), _ = client._make_request.calls[0]
+        assert 'fixVersion = "v3"' in params['jql']
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_stories_for_epic(self):
+    def test_get_stories_for_epic(self, jira_client):
         """Test getting stories for a specific epic"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock the _make_request method to return stories for different JQL queries
         def mock_request(endpoint, params=None):
-            if params and 'jql' in params:
-                jql = params['jql']
-                if 'PROJ-100' in jql:
-                    return {"issues": MOCK_STORIES["PROJ-100"]}
-            return {"issues": []}
+            return get_mock_search_response((params or {}).get('jql', ''))
         
-        client._make_request = Mock(side_effect=mock_request)
+        client._make_request = RecordingStub(side_effect=mock_request)
         
         result = client.get_stories_for_epic("PROJ-100")
         
         assert len(result) > 0
         # Should have tried multiple JQL patterns
-        assert client._make_request.call_count >= 1
+        assert len(client._make_request.calls) >= 1
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_story_points(self):
+    @pytest.mark.parametrize("fields,expected", [
+        ({"customfield_10016": 8.0}, 8.0),          # valid story points
+        ({}, None),                                 # no story points
+        ({"customfield_10016": "invalid"}, None),   # invalid story points
+    ])
+    def test_get_story_points(self, jira_client, fields, expected):
         """Test extracting story points from a story"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
-        
-        # Test with valid story points
-        story_with_points = {
-            "fields": {
-                "customfield_10016": 8.0
-            }
-        }
-        
-        # Test with no story points
-        story_without_points = {
-            "fields": {}
-        }
-        
-        # Test with invalid story points
-        story_invalid_points = {
-            "fields": {
-                "customfield_10016": "invalid"
-            }
-        }
+        config, client = jira_client
         
-        assert client.get_story_points(story_with_points) == 8.0
-        assert client.get_story_points(story_without_points) is None
-        assert client.get_story_points(story_invalid_points) is None
+        assert client.get_story_points({"fields": fields}) == expected
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_project_versions(self):
+    def test_get_project_versions(self, jira_client):
         """Test getting project versions (with pagination fix)"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
+        config, client = jira_client
         
-        config = JiraConfig()
-        client = JiraClient(config)
-        
-        # Mock the _make_request method to return paginated response
-        client._make_request = Mock(return_value=MOCK_VERSIONS)
+        # Stub the _make_request method to return paginated response
+        client._make_request = RecordingStub(response=MOCK_VERSIONS)
         
         result = client.get_project_versions()
         
@@ -193,18 +127,13 @@ class TestJiraClient:
         assert result[1]["name"] == "v2"
         
         # Verify correct endpoint was called
-        client._make_request.assert_called_once()
-        call_args = client._make_request.call_args
-        assert f'project/{config.project_key}/version' in call_args[0][0]
+        assert len(client._make_request.calls) == 1
+        (endpoint,), _ = client._make_request.calls[0]
+        assert f'project/{config.project_key}/version' in endpoint
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_available_versions(self):
+    def test_get_available_versions(self, jira_client):
         """Test getting available version names"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock get_project_versions
         client.get_project_versions = Mock(return_value=MOCK_VERSIONS["values"])
@@ -213,82 +142,59 @@ class TestJiraClient:
         
         assert result == ["v3", "v2"]
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_version_details(self):
+    @pytest.mark.parametrize("version_name,expected_id", [
+        ("v3", "10047"),   # existing version
+        ("v99", None),     # non-existing version
+    ])
+    def test_get_version_details(self, jira_client, version_name, expected_id):
         """Test getting details for a specific version"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock get_project_versions
         client.get_project_versions = Mock(return_value=MOCK_VERSIONS["values"])
         
-        # Test existing version
-        result = client.get_version_details("v3")
-        assert result is not None
-        assert result["name"] == "v3"
-        assert result["id"] == "10047"
-        
-        # Test non-existing version
-        result = client.get_version_details("v99")
-        assert result is None
+        result = client.get_version_details(version_name)
+        if expected_id is None:
+            assert result is None
+        else:
+            assert result["name"] == version_name
+            assert result["id"] == expected_id
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_get_custom_field_id(self):
+    @pytest.mark.parametrize("field_name,expected", [
+        ("Story Points", "customfield_10016"),   # existing field
+        ("Non-existing Field", None),            # non-existing field
+    ])
+    def test_get_custom_field_id(self, jira_client, field_name, expected):
         """Test finding custom field ID by name"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock the _make_request method
         client._make_request = Mock(return_value=MOCK_FIELDS)
         
-        # Test finding existing field
-        result = client.get_custom_field_id("Story Points")
-        assert result == "customfield_10016"
-        
-        # Test finding non-existing field
-        result = client.get_custom_field_id("Non-existing Field")
-        assert result is None
+        assert client.get_custom_field_id(field_name) == expected
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    @patch('utils.jira_client.requests.get')
-    def test_test_connection_success(self, mock_get):
+    def test_test_connection_success(self, mocker, jira_client, http_response):
         """Test successful connection test"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
+        mock_get = mocker.patch('utils.jira_client.requests.get')
         
         # Mock successful response
-        mock_response = Mock()
-        mock_response.json.return_value = {"displayName": "Test User"}
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = http_response({"displayName": "Test User"})
         
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         result = client.test_connection()
         
         assert result == True
         mock_get.assert_called_once()
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    @patch('utils.jira_client.requests.get')
-    def test_test_connection_failure(self, mock_get):
+    def test_test_connection_failure(self, mocker, jira_client):
         """Test connection test failure"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        import requests
+        mock_get = mocker.patch('utils.jira_client.requests.get')
         
         # Mock failed response
         mock_get.side_effect = requests.exceptions.ConnectionError("Connection failed")
         
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         result = client.test_connection()
         
@@ -298,31 +204,20 @@ class TestJiraClient:
 class TestJiraClientVersionFiltering:
     """Test version filtering functionality specifically"""
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_version_filtering_integration(self):
+    def test_version_filtering_integration(self, jira_client):
         """Test complete version filtering workflow"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock the API responses
         def mock_request(endpoint, params=None):
             if 'version' in endpoint:
                 return MOCK_VERSIONS
             elif 'search' in endpoint and params:
-                jql = params.get('jql', '')
-                if 'fixVersion = "v3"' in jql:
-                    # Return only v3 epics
-                    return {"issues": [epic for epic in MOCK_EPICS if any(
-                        v.get("name") == "v3" for v in epic["fields"].get("fixVersions", [])
-                    )]}
-                else:
-                    return {"issues": MOCK_EPICS}
+                # Only v3 epics for the version filter, all epics otherwise
+                return get_mock_search_response(params.get('jql', ''), default=ALL_EPICS_RESPONSE)
             return {}
         
-        client._make_request = Mock(side_effect=mock_request)
+        client._make_request = RecordingStub(side_effect=mock_request)
         
         # Test getting available versions
         versions = client.get_available_versions()
@@ -333,25 +228,16 @@ class TestJiraClientVersionFiltering:
         assert len(epics) > 0
         
         # Verify the filter was applied
-        version_calls = [call for call in client._make_request.call_args_list 
-                        if 'search' in call[0][0]]
-        assert len(version_calls) > 0
+        search_calls = [args for args, _ in client._make_request.calls if 'search' in args[0]]
+        assert len(search_calls) > 0
         
         # Check that version filter was included in JQL
-        jql_call = version_calls[0]
-        # Fix: Access params correctly - call_args[0][1] is the params dict
-        params = jql_call[0][1]  # Second element of the positional args tuple
-        jql = params['jql']
-        assert 'fixVersion = "v3"' in jql
+        _, params = search_calls[0]
+        assert 'fixVersion = "v3"' in params['jql']
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_version_api_response_parsing(self):
+    def test_version_api_response_parsing(self, jira_client):
         """Test that version API response is parsed correctly"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock the exact response format from JIRA
         mock_response = {
@@ -391,14 +277,9 @@ class TestJiraClientVersionFiltering:
         assert versions[0]["id"] == "10047"
         assert versions[1]["id"] == "10046"
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_empty_version_response(self):
+    def test_empty_version_response(self, jira_client):
         """Test handling of empty version response"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock empty response
         mock_response = {
@@ -413,14 +294,9 @@ class TestJiraClientVersionFiltering:
         assert versions == []
         assert available_versions == []
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_version_sorting(self):
+    def test_version_sorting(self, jira_client):
         """Test that versions are sorted correctly"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock response with versions in different order
         mock_response = {
@@ -462,14 +338,9 @@ class TestJiraClientVersionFiltering:
 class TestJiraClientErrorHandling:
     """Test error handling in JIRA client"""
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_version_api_error_handling(self):
+    def test_version_api_error_handling(self, jira_client):
         """Test handling of version API errors"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock API error
         client._make_request = Mock(side_effect=Exception("API Error"))
@@ -481,14 +352,9 @@ class TestJiraClientErrorHandling:
         available_versions = client.get_available_versions()
         assert available_versions == []
     
-    @patch.dict(os.environ, TEST_CONFIG)
-    def test_custom_field_error_handling(self):
+    def test_custom_field_error_handling(self, jira_client):
         """Test handling of custom field API errors"""
-        from utils.config import JiraConfig
-        from utils.jira_client import JiraClient
-        
-        config = JiraConfig()
-        client = JiraClient(config)
+        config, client = jira_client
         
         # Mock API error
         client._make_request = Mock(side_effect=Exception("API Error"))
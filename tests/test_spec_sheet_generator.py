@@ -2,25 +2,51 @@
 Unit tests for the Enhanced Spec Sheet Generator
 """
 import pytest
-import os
-import sys
-import tempfile
-from unittest.mock import Mock, patch, MagicMock
-import openpyxl
+from types import SimpleNamespace
 
-# Add the project root to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+from spec_sheet.spec_sheet_generator import EnhancedSpecSheetSync
+from spec_sheet.sprint.sprint_planner import Team
+from team.team_manager import TeamMember
+from tests.test_data import MOCK_EPICS, MOCK_STORIES, ALL_RISK_PROFILES, get_total_story_points
+from tests.conftest import RecordingStub, FakeWorkbook, _set_test_env, get_sheet_data, count_non_empty_rows
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _jira_env():
+    """Point every test in this module at the test Jira settings, restored afterwards"""
+    with pytest.MonkeyPatch.context() as mp:
+        _set_test_env(mp)
+        yield
+
+
+SCOPE_HEADERS = (
+    "Item", "MoSCoW", "Risk Profile", "Details",
+    "SP (Proven)", "Fixed Price", "SP (Experimental)",
+    "Min Price", "Max Price", "SP (Dependant)", "Hourly Estimate"
+)
+DOD_HEADERS = ("Definition of Done", "MoSCoW", "Price Impact", "Price Impact %")
+
+DOD_CATEGORIES = frozenset({
+    "Code quality & documentation",
+    "Performance & optimization",
+    "UI/UX & animations",
+    "Error handling & logging",
+    "Testing & Cross-browser compatibility",
+    "Security & deployment",
+})
+
+# Stories whose MoSCoW priority comes from the Jira priority field alone (shared, read-only)
+PRIORITY_STORIES = tuple(
+    {'key': f'PROJ-{i}', 'fields': {'priority': {'name': name}, 'labels': ()}}
+    for i, name in enumerate(('Highest', 'High', 'Medium', 'Low'), 1)
+)
 
-from tests.test_data import MOCK_EPICS, MOCK_STORIES, get_total_story_points
-from tests.conftest import assert_workbook_has_sheet, get_sheet_data, count_non_empty_rows
 
 class TestTeamMember:
     """Test TeamMember class"""
     
-    def test_team_member_creation(self, spec_sheet_classes):
+    def test_team_member_creation(self):
         """Test creating a team member"""
-        TeamMember = spec_sheet_classes['TeamMember']
-        
         member = TeamMember("John Doe", "Senior Developer", 1.0, 8, 110)
         
         assert member.name == "John Doe"
@@ -29,20 +55,16 @@ class TestTeamMember:
         assert member.story_points_per_sprint == 8
         assert member.hourly_rate == 110
     
-    def test_team_member_partial_fte(self, spec_sheet_classes):
+    def test_team_member_partial_fte(self):
         """Test team member with partial FTE"""
-        TeamMember = spec_sheet_classes['TeamMember']
-        
         member = TeamMember("Jane Smith", "Designer", 0.5, 6, 85)
         
         # Calculate effective velocity manually
         effective_velocity = member.story_points_per_sprint * member.availability
         assert effective_velocity == 3.0  # 6 * 0.5
     
-    def test_team_member_string_representation(self, spec_sheet_classes):
+    def test_team_member_string_representation(self):
         """Test string representation of team member"""
-        TeamMember = spec_sheet_classes['TeamMember']
-        
         member = TeamMember("Bob Wilson", "Junior Developer", 0.8, 5, 75)
         
         # Test that we can access the member properties (the current TeamMember uses dataclass __str__)
@@ -55,10 +77,8 @@ class TestTeamMember:
 class TestTeam:
     """Test Team class"""
     
-    def test_empty_team(self, spec_sheet_classes):
+    def test_empty_team(self):
         """Test empty team creation"""
-        Team = spec_sheet_classes['Team']
-        
         team = Team("Test Team")
         
         assert team.name == "Test Team"
@@ -66,23 +86,9 @@ class TestTeam:
         assert team.get_total_velocity() == 0
         assert team.get_total_fte() == 0
     
-    def test_team_with_members(self, spec_sheet_classes, sample_team_data):
+    def test_team_with_members(self, built_team):
         """Test team with multiple members"""
-        Team = spec_sheet_classes['Team']
-        TeamMember = spec_sheet_classes['TeamMember']
-        
-        team = Team("Development Team")
-        
-        # Add members with correct TeamMember constructor (name, role, availability, story_points_per_sprint, hourly_rate)
-        for i, member_data in enumerate(sample_team_data):
-            member = TeamMember(
-                f"Member {i+1}",  # name
-                member_data["role"],  # role
-                member_data["fte"],  # availability
-                member_data["story_points_per_sprint"],  # story_points_per_sprint
-                member_data["hourly_rate"]  # hourly_rate
-            )
-            team.add_member(member)
+        team = built_team
         
         # Test calculations
         assert len(team.members) == 3
@@ -92,16 +98,12 @@ class TestTeam:
         expected_velocity = (8 + 5 + 3) * 0.85  # 16 * 0.85 = 13.6
         assert team.get_total_velocity() == expected_velocity
     
-    def test_team_composition_summary(self, spec_sheet_classes, sample_team_data):
+    def test_team_composition_summary(self, sample_members):
         """Test team composition summary"""
-        Team = spec_sheet_classes['Team']
-        TeamMember = spec_sheet_classes['TeamMember']
-        
         team = Team("Test Team")
         
-        # Add one member with correct constructor (name, role, availability, story_points_per_sprint, hourly_rate)
-        member = TeamMember("Alice Johnson", "Senior Developer", 1.0, 8, 110)
-        team.add_member(member)
+        # Add one member: the 1.0 FTE Senior Developer from the sample team
+        team.add_member(sample_members[0])
         
         summary = team.get_composition_summary()
         
@@ -114,40 +116,11 @@ class TestTeam:
 class TestEnhancedSpecSheetSync:
     """Test the main EnhancedSpecSheetSync class"""
     
-    @patch.dict(os.environ, {
-        'JIRA_DOMAIN': 'https://test.atlassian.net',
-        'JIRA_EMAIL': 'test@test.com',
-        'JIRA_API_TOKEN': 'test-token',
-        'JIRA_PROJECT_KEY': 'TEST',
-        'JIRA_STORY_POINTS_FIELD': 'customfield_10016',
-        'JIRA_TYPE_OF_WORK_FIELD': 'customfield_10273'
-    })
-    def test_calculate_sprint_estimates(self, sample_team_data, spec_sheet_classes):
+    def test_calculate_sprint_estimates(self, built_team, spec_sheet_sync):
         """Test sprint calculation functionality"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        Team = spec_sheet_classes['Team']
-        TeamMember = spec_sheet_classes['TeamMember']
-        
-        # Create a team
-        team = Team("Test Team")
-        for i, member_data in enumerate(sample_team_data):
-            member = TeamMember(
-                f"Test Member {i+1}",  # name
-                member_data["role"],  # role
-                member_data["fte"],  # availability
-                member_data["story_points_per_sprint"],  # story_points_per_sprint
-                member_data["hourly_rate"]  # hourly_rate
-            )
-            team.add_member(member)
-        
-        # Mock the sync instance
-        sync = EnhancedSpecSheetSync()
-        sync.jira_client = Mock()
-        sync.jira_config = Mock()
-        
         # Test calculation
         total_story_points = 40
-        estimates = sync.orchestrator.sprint_planner.calculate_sprint_estimates(total_story_points, team)
+        estimates = spec_sheet_sync.orchestrator.sprint_planner.calculate_sprint_estimates(total_story_points, built_team)
         
         assert estimates['total_story_points'] == 40
         assert estimates['team_velocity'] > 0
@@ -156,138 +129,53 @@ class TestEnhancedSpecSheetSync:
         assert estimates['months'] > 0
         assert 'team_composition' in estimates
     
-    @patch.dict(os.environ, {
-        'JIRA_DOMAIN': 'https://test.atlassian.net',
-        'JIRA_EMAIL': 'test@test.com',
-        'JIRA_API_TOKEN': 'test-token',
-        'JIRA_PROJECT_KEY': 'TEST',
-        'JIRA_STORY_POINTS_FIELD': 'customfield_10016',
-        'JIRA_TYPE_OF_WORK_FIELD': 'customfield_10273'
-    })
-    def test_determine_risk_profile(self, spec_sheet_classes):
+    @pytest.fixture(scope="module")
+    def pricing_engine(self, spec_sheet_sync):
+        """Pricing engine with fixed test prices, separate from the shared sync instance"""
+        PricingEngine = type(spec_sheet_sync.orchestrator.pricing_engine)
+        engine = PricingEngine(spec_sheet_sync.orchestrator.config_manager)
+        engine.base_story_point_price = 100.0
+        engine.experimental_variance = 0.3
+        engine.hourly_rate = 85.0
+        engine.dod_impact_total = 0.0  # Set to 0 for predictable test results
+        return engine
+    
+    @pytest.mark.parametrize("story,expected", [
+        ({"fields": {"customfield_10273": "proven"}}, "proven"),
+        ({"fields": {"customfield_10273": "experimental"}}, "experimental"),
+        ({"fields": {"customfield_10273": "dependant"}}, "dependant"),
+        ({"fields": {}}, "experimental"),  # Default
+    ])
+    def test_determine_risk_profile(self, spec_sheet_sync, story, expected):
         """Test risk profile determination"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        
-        sync = EnhancedSpecSheetSync()
-        sync.jira_client = Mock()
-        sync.jira_config = Mock()
-        # Mock get_story_points to return actual numbers instead of Mock objects
-        sync.jira_client.get_story_points = Mock(return_value=2)  # Return small number for default case
-        
-        # Test different risk profiles
-        proven_story = {"fields": {"customfield_10273": "proven"}}
-        experimental_story = {"fields": {"customfield_10273": "experimental"}}
-        dependant_story = {"fields": {"customfield_10273": "dependant"}}
-        no_type_story = {"fields": {}}
-        
-        assert sync.orchestrator.risk_assessor.determine_risk_profile(proven_story) == "proven"
-        assert sync.orchestrator.risk_assessor.determine_risk_profile(experimental_story) == "experimental"
-        assert sync.orchestrator.risk_assessor.determine_risk_profile(dependant_story) == "dependant"
-        assert sync.orchestrator.risk_assessor.determine_risk_profile(no_type_story) == "experimental"  # Default
+        assert spec_sheet_sync.orchestrator.risk_assessor.determine_risk_profile(story) == expected
     
-    @patch.dict(os.environ, {
-        'JIRA_DOMAIN': 'https://test.atlassian.net',
-        'JIRA_EMAIL': 'test@test.com',
-        'JIRA_API_TOKEN': 'test-token',
-        'JIRA_PROJECT_KEY': 'TEST',
-        'JIRA_STORY_POINTS_FIELD': 'customfield_10016',
-        'JIRA_TYPE_OF_WORK_FIELD': 'customfield_10273'
-    })
-    def test_calculate_prices(self, spec_sheet_classes):
+    @pytest.mark.parametrize("risk_profile,price_key,expected", [
+        ('proven', 'fixed', 500.0),  # Without DoD impacts, 5 * 100
+        ('experimental', 'minimum', 350.0),  # 500 * 0.7
+        ('experimental', 'maximum', 650.0),  # 500 * 1.3
+        ('dependant', 'hourly_estimate', 3400.0),  # 5 SP * 8 hours/SP * 85/hour
+    ])
+    def test_calculate_prices(self, pricing_engine, risk_profile, price_key, expected):
         """Test price calculations for different risk profiles"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        sync = EnhancedSpecSheetSync()
-        sync.jira_client = Mock()
-        sync.jira_config = Mock()
-        # Mock settings config to use test values
-        sync.settings_config = {
-            "pricing": {
-                "base_story_point_price": 100.0,
-                "experimental_variance": 0.3,
-                "base_hourly_rate": 113.33,
-                "hourly_rate_discount": 0.25
-            },
-            "sprint_planning": {
-                "hours_per_story_point": 8
-            },
-            "risk_assessment": {
-                "proven_threshold_story_points": 3,
-                "experimental_threshold_story_points": 8
-            },
-            "ui_formatting": {
-                "header_color": "366092",
-                "summary_header_color": "366092",
-                "epic_background_color": "E6F3FF",
-                "section_background_color": "D4EDDA",
-                "default_column_widths": [50, 20, 20, 30, 15, 12, 15, 12, 12, 15, 20],
-                "header_row_height": 80
-            }
-        }
-        # Set pricing engine values directly for testing
-        sync.orchestrator.pricing_engine.base_story_point_price = 100.0
-        sync.orchestrator.pricing_engine.experimental_variance = 0.3
-        sync.orchestrator.pricing_engine.hourly_rate = 85.0
-        sync.orchestrator.pricing_engine.dod_impact_total = 0.0  # Set to 0 for predictable test results
-        
-        # Test proven pricing (without DoD impacts, should be 5 * 100 = 500)
-        prices = sync.orchestrator.pricing_engine.calculate_prices(5, 'proven')
-        assert prices['fixed'] == 500.0
-        
-        # Test experimental pricing
-        prices = sync.orchestrator.pricing_engine.calculate_prices(5, 'experimental')
-        assert prices['minimum'] == 350.0  # 500 * 0.7
-        assert prices['maximum'] == 650.0  # 500 * 1.3
-        
-        # Test dependant pricing (5 story points * 8 hours/SP * 85/hour = 3400)
-        prices = sync.orchestrator.pricing_engine.calculate_prices(5, 'dependant')
-        assert prices['hourly_estimate'] == 3400.0  # 5 * 8 * 85
+        prices = pricing_engine.calculate_prices(5, risk_profile)
+        assert prices[price_key] == expected
     
-    @patch.dict(os.environ, {
-        'JIRA_DOMAIN': 'https://test.atlassian.net',
-        'JIRA_EMAIL': 'test@test.com',
-        'JIRA_API_TOKEN': 'test-token',
-        'JIRA_PROJECT_KEY': 'TEST',
-        'JIRA_STORY_POINTS_FIELD': 'customfield_10016',
-        'JIRA_TYPE_OF_WORK_FIELD': 'customfield_10273'
-    })
-    def test_get_moscow_priority(self, spec_sheet_classes):
+    @pytest.mark.parametrize("story,expected", [
+        ({"fields": {"labels": ("must-have",)}}, "Must Have"),
+        ({"fields": {"labels": ("should-have",)}}, "Should Have"),
+        ({"fields": {"labels": ("could-have",)}}, "Could Have"),
+        ({"fields": {"labels": ("wont-have",)}}, "Won't Have"),
+        ({"fields": {"priority": {"name": "High"}, "labels": ()}}, "Should Have"),  # High priority -> Should Have (per implementation)
+        ({"fields": {"labels": ()}}, "Should Have"),  # Default
+    ])
+    def test_get_moscow_priority(self, spec_sheet_sync, story, expected):
         """Test MoSCoW priority detection"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        
-        sync = EnhancedSpecSheetSync()
-        sync.jira_client = Mock()
-        sync.jira_config = Mock()
-        
-        # Test different priority scenarios
-        must_story = {"fields": {"labels": ["must-have"]}}
-        should_story = {"fields": {"labels": ["should-have"]}}
-        could_story = {"fields": {"labels": ["could-have"]}}
-        wont_story = {"fields": {"labels": ["wont-have"]}}
-        high_priority = {"fields": {"priority": {"name": "High"}, "labels": []}}
-        no_priority = {"fields": {"labels": []}}
-        
-        assert sync.orchestrator.moscow_manager.get_moscow_priority(must_story) == "Must Have"
-        assert sync.orchestrator.moscow_manager.get_moscow_priority(should_story) == "Should Have"
-        assert sync.orchestrator.moscow_manager.get_moscow_priority(could_story) == "Could Have"
-        assert sync.orchestrator.moscow_manager.get_moscow_priority(wont_story) == "Won't Have"
-        assert sync.orchestrator.moscow_manager.get_moscow_priority(high_priority) == "Should Have"  # High priority -> Should Have (per implementation)
-        assert sync.orchestrator.moscow_manager.get_moscow_priority(no_priority) == "Should Have"  # Default
+        assert spec_sheet_sync.orchestrator.moscow_manager.get_moscow_priority(story) == expected
     
-    @patch.dict(os.environ, {
-        'JIRA_DOMAIN': 'https://test.atlassian.net',
-        'JIRA_EMAIL': 'test@test.com',
-        'JIRA_API_TOKEN': 'test-token',
-        'JIRA_PROJECT_KEY': 'TEST',
-        'JIRA_STORY_POINTS_FIELD': 'customfield_10016',
-        'JIRA_TYPE_OF_WORK_FIELD': 'customfield_10273'
-    })
-    def test_create_custom_team(self, sample_team_data, spec_sheet_classes):
+    def test_create_custom_team(self, sample_team_data, spec_sheet_sync):
         """Test custom team creation"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        
-        sync = EnhancedSpecSheetSync()
-        sync.jira_client = Mock()
-        sync.jira_config = Mock()
+        sync = spec_sheet_sync
         
         custom_team = sync.orchestrator.sprint_planner.create_custom_team(sample_team_data)
         
@@ -296,117 +184,36 @@ class TestEnhancedSpecSheetSync:
         assert custom_team.get_total_fte() == 2.5
         assert custom_team.get_total_velocity() > 0
 
-    def test_moscow_priority_filtering(self, spec_sheet_classes):
+    @pytest.mark.parametrize("selected_priorities,expected_keys", [
+        (['Must Have', 'Should Have'], ['PROJ-1', 'PROJ-2']),  # Highest -> Must Have, High -> Should Have
+        (['Could Have'], ['PROJ-3']),  # Medium -> Could Have
+        (['Must Have', 'Should Have', 'Could Have', 'Won\'t Have'], ['PROJ-1', 'PROJ-2', 'PROJ-3', 'PROJ-4']),  # No filtering
+    ])
+    def test_moscow_priority_filtering(self, spec_sheet_sync, selected_priorities, expected_keys):
         """Test MoSCoW priority filtering functionality"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        sync = EnhancedSpecSheetSync()
-        
-        # Mock stories with different MoSCoW priorities
-        mock_stories = [
-            {
-                'key': 'PROJ-1',
-                'fields': {
-                    'priority': {'name': 'Highest'},
-                    'labels': []
-                }
-            },
-            {
-                'key': 'PROJ-2',
-                'fields': {
-                    'priority': {'name': 'High'},
-                    'labels': []
-                }
-            },
-            {
-                'key': 'PROJ-3',
-                'fields': {
-                    'priority': {'name': 'Medium'},
-                    'labels': []
-                }
-            },
-            {
-                'key': 'PROJ-4',
-                'fields': {
-                    'priority': {'name': 'Low'},
-                    'labels': []
-                }
-            }
-        ]
-        
-        # Test filtering for Must Have and Should Have only
-        selected_priorities = ['Must Have', 'Should Have']
-        filtered_stories, priority_counts = sync.orchestrator.moscow_manager.filter_stories_by_moscow(mock_stories, selected_priorities)
-        
-        assert len(filtered_stories) == 2  # Only Must Have and Should Have
-        assert filtered_stories[0]['key'] == 'PROJ-1'  # Must Have (Highest)
-        assert filtered_stories[1]['key'] == 'PROJ-2'  # Should Have (High)
-        
-        # Test filtering for Could Have only
-        selected_priorities = ['Could Have']
-        filtered_stories, priority_counts = sync.orchestrator.moscow_manager.filter_stories_by_moscow(mock_stories, selected_priorities)
-        
-        assert len(filtered_stories) == 1
-        assert filtered_stories[0]['key'] == 'PROJ-3'  # Could Have (Medium)
+        filtered_stories, priority_counts = spec_sheet_sync.orchestrator.moscow_manager.filter_stories_by_moscow(
+            PRIORITY_STORIES, selected_priorities)
         
-        # Test no filtering (all priorities)
-        selected_priorities = ['Must Have', 'Should Have', 'Could Have', 'Won\'t Have']
-        filtered_stories, priority_counts = sync.orchestrator.moscow_manager.filter_stories_by_moscow(mock_stories, selected_priorities)
-        
-        assert len(filtered_stories) == 4  # All stories
+        assert [story['key'] for story in filtered_stories] == expected_keys
 
-    def test_moscow_priority_detection_from_labels(self, spec_sheet_classes):
+    @pytest.mark.parametrize("priority,labels,expected", [
+        ('Medium', ('must-have', 'feature'), 'Must Have'),  # Label wins over a different priority
+        ('Low', ('should', 'enhancement'), 'Should Have'),
+        ('High', ('could-have', 'nice-to-have'), 'Could Have'),
+        ('Highest', ('wont-have', 'out-of-scope'), 'Won\'t Have'),
+    ])
+    def test_moscow_priority_detection_from_labels(self, spec_sheet_sync, priority, labels, expected):
         """Test MoSCoW priority detection from Jira labels"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        sync = EnhancedSpecSheetSync()
-        
-        # Test story with must-have label
-        story_with_must_label = {
-            'fields': {
-                'priority': {'name': 'Medium'},  # Different priority
-                'labels': ['must-have', 'feature']
-            }
-        }
-        priority = sync.orchestrator.moscow_manager.get_moscow_priority(story_with_must_label)
-        assert priority == 'Must Have'
-        
-        # Test story with should-have label
-        story_with_should_label = {
-            'fields': {
-                'priority': {'name': 'Low'},
-                'labels': ['should', 'enhancement']
-            }
-        }
-        priority = sync.orchestrator.moscow_manager.get_moscow_priority(story_with_should_label)
-        assert priority == 'Should Have'
-        
-        # Test story with could-have label
-        story_with_could_label = {
-            'fields': {
-                'priority': {'name': 'High'},
-                'labels': ['could-have', 'nice-to-have']
-            }
-        }
-        priority = sync.orchestrator.moscow_manager.get_moscow_priority(story_with_could_label)
-        assert priority == 'Could Have'
-        
-        # Test story with won't-have label
-        story_with_wont_label = {
-            'fields': {
-                'priority': {'name': 'Highest'},
-                'labels': ['wont-have', 'out-of-scope']
-            }
-        }
-        priority = sync.orchestrator.moscow_manager.get_moscow_priority(story_with_wont_label)
-        assert priority == 'Won\'t Have'
+        story = {'fields': {'priority': {'name': priority}, 'labels': labels}}
+        assert spec_sheet_sync.orchestrator.moscow_manager.get_moscow_priority(story) == expected
 
-    def test_sync_with_moscow_filtering_integration(self, spec_sheet_classes):
+    def test_sync_with_moscow_filtering_integration(self):
         """Test integration of MoSCoW filtering in epic-story hierarchy sync process"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
+        # Own instance: this test replaces state on the orchestrator itself
         sync = EnhancedSpecSheetSync()
         
-        # Set up mocks on the orchestrator (new modular architecture)
-        sync.orchestrator.jira_client = Mock()
-        sync.orchestrator.jira_config = Mock()
+        # Set up stubs on the orchestrator (new modular architecture)
+        sync.orchestrator.jira_config = SimpleNamespace()
         
         # Mock epics and stories (epic-story hierarchy approach)
         mock_epics = [
@@ -448,18 +255,16 @@ class TestEnhancedSpecSheetSync:
         sync.orchestrator.everything_else_items = mock_everything_else
         sync.orchestrator.selected_version = 'Test Version'
         
-        # Mock jira client methods
-        sync.orchestrator.jira_client.get_story_points.return_value = 3
-        sync.orchestrator.jira_client.get_stories_for_epic.return_value = mock_stories
+        # Stub jira client methods
+        sync.orchestrator.jira_client = SimpleNamespace(
+            get_story_points=lambda story: 3,
+            get_stories_for_epic=RecordingStub(response=mock_stories)
+        )
     
-        # Mock workbook and worksheet on excel manager
-        from unittest.mock import MagicMock
-        sync.orchestrator.excel_manager.workbook = MagicMock()
-        sync.orchestrator.excel_manager.workbook.sheetnames = ['Scope (Quantity)']
-        mock_ws = MagicMock()
-        sync.orchestrator.excel_manager.workbook.__getitem__.return_value = mock_ws
+        # Stub workbook on excel manager
+        fake_wb = FakeWorkbook(['Scope (Quantity)'])
+        sync.orchestrator.excel_manager.workbook = fake_wb
         sync.orchestrator.excel_manager.spec_sheet_path = 'test.xlsx'
-        sync.orchestrator.excel_manager.workbook.save = Mock()
     
         # Test sync with Must Have filter only
         selected_priorities = ['Must Have']
@@ -469,91 +274,86 @@ class TestEnhancedSpecSheetSync:
         assert sync.orchestrator.selected_moscow_priorities == selected_priorities
         
         # Verify the workbook was saved (indicating successful sync)
-        sync.orchestrator.excel_manager.workbook.save.assert_called_once()
+        assert fake_wb.saved is True
+        
+        # Only the Must Have story is written; the Won't Have bug is filtered out
+        written = " ".join(str(value) for value in fake_wb['Scope (Quantity)'].values())
+        assert "PROJ-1" in written
+        assert "PROJ-2" not in written
         
         # Verify that get_stories_for_epic was called for each epic
-        sync.orchestrator.jira_client.get_stories_for_epic.assert_called_with('EPIC-1')
+        assert sync.orchestrator.jira_client.get_stories_for_epic.calls[-1] == (('EPIC-1',), {})
 
 
+@pytest.mark.slow
 class TestSpreadsheetGeneration:
-    """Test spreadsheet generation functionality"""
+    """Test spreadsheet generation functionality (read-only, on the shared workbook)"""
     
-    def test_workbook_creation(self, test_workbook):
+    def test_workbook_creation(self, loaded_workbook):
         """Test that test workbook is created correctly"""
-        assert os.path.exists(test_workbook)
-        
-        # Check sheets exist
-        assert_workbook_has_sheet(test_workbook, "Scope (Quantity)")
-        assert_workbook_has_sheet(test_workbook, "Definition of Done (Quality)")
-        assert_workbook_has_sheet(test_workbook, "Settings")
+        # Check sheets exist (the workbook is opened once per module)
+        assert {"Scope (Quantity)", "Definition of Done (Quality)", "Settings"} <= set(loaded_workbook.sheetnames)
     
-    def test_scope_sheet_headers(self, test_workbook):
+    def test_scope_sheet_headers(self, shared_workbook):
         """Test that scope sheet has correct headers"""
-        data = get_sheet_data(test_workbook, "Scope (Quantity)")
+        data = get_sheet_data(shared_workbook, "Scope (Quantity)", max_rows=1)
         
         # Check header row
-        expected_headers = [
-            "Item", "MoSCoW", "Risk Profile", "Details", 
-            "SP (Proven)", "Fixed Price", "SP (Experimental)", 
-            "Min Price", "Max Price", "SP (Dependant)", "Hourly Estimate"
-        ]
-        
-        assert data[0] == expected_headers
+        assert tuple(data[0]) == SCOPE_HEADERS
     
-    def test_dod_impact_sheet_data(self, test_workbook):
+    def test_dod_impact_sheet_data(self, shared_workbook):
         """Test Definition of Done (Quality) sheet contains comprehensive quality standards"""
-        data = get_sheet_data(test_workbook, "Definition of Done (Quality)")
+        data = get_sheet_data(shared_workbook, "Definition of Done (Quality)")
         
         # Should have header + DoD items + category headers + sum row (test fixture has simplified structure)
         assert len(data) >= 10  # Header + some categories and items + sum row
-        assert data[0] == ["Definition of Done", "MoSCoW", "Price Impact", "Price Impact %"]
+        assert tuple(data[0]) == DOD_HEADERS
         
-        # Check that some category headers are present (test fixture has 3 categories)
+        # Collect categories, items, MoSCoW values, the expected sum and Won't Have violations in one pass
         categories_found = []
+        dod_items = []
+        moscow_values = set()
+        sum_rows = []
+        expected_sum = 0
+        wont_have_violations = []
         for row in data[1:]:
-            if len(row) > 0 and row[0] in [
-                "Code quality & documentation",
-                "Performance & optimization", 
-                "UI/UX & animations",
-                "Error handling & logging",
-                "Testing & Cross-browser compatibility",
-                "Security & deployment"
-            ]:
+            if not row:
+                continue
+            dod_items.append(row[0])
+            if row[0] in DOD_CATEGORIES:
                 categories_found.append(row[0])
+            if len(row) > 1 and row[1]:
+                moscow_values.add(row[1])
+            if len(row) >= 4:
+                if row[2] == "Sum":
+                    sum_rows.append(row)
+                elif isinstance(row[3], (int, float)):
+                    expected_sum += row[3]
+                    if row[1] == "Won't Have" and row[3] != 0.0:
+                        wont_have_violations.append(row)
         
         assert len(categories_found) >= 3, f"Expected at least 3 categories, found {len(categories_found)}: {categories_found}"
         
         # Check some key DoD items are present
-        dod_items = [row[0] for row in data[1:] if len(row) > 0]
         assert "Code is structured, modular, and follows best practices" in dod_items
         assert "API calls are debounced to increase performance" in dod_items
         assert "Security vulnerabilities are identified and mitigated" in dod_items
         
         # Check that sum row exists and is calculated correctly
-        sum_rows = [row for row in data if len(row) >= 4 and row[2] == "Sum"]
         assert len(sum_rows) == 1, "Should have exactly one sum row"
-        
-        # Calculate expected sum from actual DoD items with numeric percentages
-        expected_sum = sum(
-            row[3] for row in data[1:] 
-            if len(row) >= 4 and isinstance(row[3], (int, float)) and row[2] != "Sum"
-        )
         assert sum_rows[0][3] == expected_sum, f"Sum should be {expected_sum} (calculated), but got {sum_rows[0][3]}"
         
         # Check that MoSCoW priorities are correctly assigned
-        moscow_values = [row[1] for row in data[1:] if len(row) > 1 and row[1]]
         assert "Must Have" in moscow_values
         assert "Could Have" in moscow_values
         assert "Won't Have" in moscow_values
         
         # Check that Won't Have items have 0 impact
-        for row in data[1:]:
-            if len(row) >= 4 and row[1] == "Won't Have" and isinstance(row[3], (int, float)):
-                assert row[3] == 0.0, f"Won't Have items should have 0% impact, but {row[0]} has {row[3]}"
+        assert not wont_have_violations, f"Won't Have items should have 0% impact: {wont_have_violations}"
     
-    def test_settings_sheet_data(self, test_workbook):
+    def test_settings_sheet_data(self, shared_workbook):
         """Test Settings sheet contains expected configuration"""
-        data = get_sheet_data(test_workbook, "Settings")
+        data = get_sheet_data(shared_workbook, "Settings", max_rows=6)
         
         # Should have header + settings
         assert len(data) >= 5
@@ -569,41 +369,25 @@ class TestSpreadsheetGeneration:
 class TestIntegration:
     """Integration tests for the complete workflow"""
     
-    @patch.dict(os.environ, {
-        'JIRA_DOMAIN': 'https://test.atlassian.net',
-        'JIRA_EMAIL': 'test@test.com',
-        'JIRA_API_TOKEN': 'test-token',
-        'JIRA_PROJECT_KEY': 'TEST',
-        'JIRA_STORY_POINTS_FIELD': 'customfield_10016',
-        'JIRA_TYPE_OF_WORK_FIELD': 'customfield_10273'
-    })
-    def test_full_sync_workflow(self, mock_jira_client, test_workbook, spec_sheet_classes):
+    @pytest.mark.slow
+    def test_full_sync_workflow(self, mock_jira_client, shared_workbook, loaded_workbook, sync_instance):
         """Test the complete sync workflow"""
-        EnhancedSpecSheetSync = spec_sheet_classes['EnhancedSpecSheetSync']
-        
-        sync = EnhancedSpecSheetSync()
-        sync.spec_sheet_path = test_workbook
+        sync = sync_instance
+        sync.spec_sheet_path = shared_workbook
         sync.jira_client = mock_jira_client
-        sync.jira_config = Mock()
-        
-        # Mock the workbook loading
-        sync.workbook = openpyxl.load_workbook(test_workbook)
-        
-        # Test connection (mock it to return True)
-        sync.test_connections = Mock(return_value=True)
-        assert sync.test_connections() == True
-        
-        # Test sync - this should not raise exceptions
-        try:
-            sync.sync_to_scope_sheet = Mock()  # Mock the actual sync method
-            sync.sync_to_scope_sheet()
-            success = True
-        except Exception as e:
-            print(f"Sync failed: {e}")
-            success = False
-        
-        # We expect this to work with our mocked data
-        assert success == True
+        sync.jira_config = SimpleNamespace()
+        
+        # Workbook loading is not under test; reuse the module's read-only copy
+        sync.workbook = loaded_workbook
+        
+        # Test connection (stubbed to succeed)
+        sync.test_connections = lambda: True
+        assert sync.test_connections()
+        
+        # Test sync - any exception fails the test
+        sync.sync_to_scope_sheet = RecordingStub(response=True)  # Stub the actual sync method
+        assert sync.sync_to_scope_sheet() is True
+        assert len(sync.sync_to_scope_sheet.calls) == 1
     
     def test_data_consistency(self):
         """Test that our test data is consistent and complete"""
@@ -611,22 +395,24 @@ class TestIntegration:
         assert len(MOCK_EPICS) > 0
         
         # Verify each epic has stories
-        for epic in MOCK_EPICS:
-            epic_key = epic["key"]
-            assert epic_key in MOCK_STORIES
-            assert len(MOCK_STORIES[epic_key]) > 0
+        epic_keys = {epic["key"] for epic in MOCK_EPICS}
+        assert MOCK_STORIES.keys() >= epic_keys
+        assert all(MOCK_STORIES[epic_key] for epic_key in epic_keys)
         
         # Verify story points are present
         total_sp = get_total_story_points()
         assert total_sp > 0
         
         # Verify different risk profiles exist
-        risk_profiles = set()
-        for stories in MOCK_STORIES.values():
-            for story in stories:
-                risk_profile = story["fields"].get("customfield_10273", "proven")
-                risk_profiles.add(risk_profile)
-        
-        assert len(risk_profiles) > 1  # Should have multiple risk profiles
-        assert "proven" in risk_profiles
-        assert "experimental" in risk_profiles 
\ No newline at end of file
+        assert len(ALL_RISK_PROFILES) > 1  # Should have multiple risk profiles
+        assert "proven" in ALL_RISK_PROFILES
+        assert "experimental" in ALL_RISK_PROFILES
+    
+    def test_mock_data_is_frozen(self):
+        """Test that shared mock data cannot be mutated by a test"""
+        with pytest.raises(TypeError):
+            MOCK_EPICS[0]["fields"]["summary"] = "Changed"
+        with pytest.raises(TypeError):
+            MOCK_STORIES["PROJ-100"] = ()
+        with pytest.raises(AttributeError):
+            MOCK_EPICS[0]["fields"]["fixVersions"].append({"name": "v4"})
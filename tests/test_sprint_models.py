@@ -0,0 +1,112 @@
+"""
+Unit tests for sprint capacity calculations
+"""
+import pytest
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from timeline.holiday_manager import HolidayInfo, HolidayManager
+from timeline.sprint_models import SprintCalculator, count_weekdays
+
+
+def _working_days_by_scan(holiday_manager, start_date, end_date, member):
+    """Reference day-by-day count"""
+    working_days = 0
+    current_date = start_date
+    while current_date <= end_date:
+        if current_date.weekday() < 5 and not holiday_manager.is_holiday(current_date, member.name):
+            working_days += 1
+        current_date += timedelta(days=1)
+    return working_days
+
+
+class TestWorkingDays:
+    """Test working day counts for team members"""
+
+    @pytest.fixture
+    def holiday_manager(self):
+        manager = HolidayManager()
+        manager.holidays.extend([
+            HolidayInfo(date(2025, 1, 1), "Nieuwjaarsdag"),
+            HolidayInfo(date(2025, 4, 26), "Saturday Holiday"),
+            HolidayInfo(date(2025, 4, 28), "Bridge Day", is_national=False, affected_members=["Alice"]),
+            HolidayInfo(date(2025, 5, 1), "Dag van de Arbeid"),
+            HolidayInfo(date(2025, 5, 1), "Personal Day Off", is_national=False, affected_members=["Alice"]),
+            HolidayInfo(date(2025, 5, 2), "Long Weekend", is_national=False, affected_members=["Alice", "Bob"]),
+            HolidayInfo(date(2025, 5, 2), "Long Weekend", is_national=False, affected_members=["Alice"]),
+        ])
+        return manager
+
+    @pytest.mark.parametrize("start,end,expected", [
+        (date(2025, 4, 28), date(2025, 5, 4), 5),  # Monday to Sunday
+        (date(2025, 5, 3), date(2025, 5, 4), 0),  # Weekend only
+        (date(2025, 5, 2), date(2025, 5, 6), 3),  # Friday to Tuesday
+        (date(2025, 5, 6), date(2025, 5, 6), 1),
+        (date(2025, 5, 6), date(2025, 5, 5), 0),  # End before start
+        (date(2025, 1, 1), date(2025, 12, 31), 261),
+    ])
+    def test_count_weekdays(self, start, end, expected):
+        """Test the closed-form weekday count"""
+        assert count_weekdays(start, end) == expected
+
+    def test_personal_and_national_holidays(self, holiday_manager):
+        """Test that overlapping national and personal holidays are counted once"""
+        calculator = SprintCalculator(holiday_manager)
+        week = (date(2025, 4, 28), date(2025, 5, 4))
+
+        assert calculator.calculate_working_days(*week, SimpleNamespace(name="Alice")) == 2
+        assert calculator.calculate_working_days(*week, SimpleNamespace(name="Bob")) == 3
+        assert calculator.calculate_working_days(*week, SimpleNamespace(name="Carol")) == 4
+
+    def test_matches_day_by_day_scan(self, holiday_manager):
+        """Test the closed-form count against a plain day-by-day scan"""
+        calculator = SprintCalculator(holiday_manager)
+        members = [SimpleNamespace(name=name) for name in ("Alice", "Bob", "Carol")]
+
+        for offset in range(0, 150, 3):
+            start = date(2024, 12, 20) + timedelta(days=offset)
+            for length in (0, 1, 4, 9, 13, 40):
+                end = start + timedelta(days=length)
+                for member in members:
+                    expected = _working_days_by_scan(holiday_manager, start, end, member)
+                    assert calculator.calculate_working_days(start, end, member) == expected
+
+    def test_holidays_added_after_first_query(self, holiday_manager):
+        """Test that holidays added later are picked up"""
+        calculator = SprintCalculator(holiday_manager)
+        member = SimpleNamespace(name="Bob")
+        week = (date(2025, 5, 5), date(2025, 5, 11))
+        assert calculator.calculate_working_days(*week, member) == 5
+
+        holiday_manager.holidays.append(HolidayInfo(date(2025, 5, 5), "Bevrijdingsdag"))
+
+        assert calculator.calculate_working_days(*week, member) == 4
+
+    def test_repeated_queries_are_cached(self, holiday_manager, mocker):
+        """Test that identical spans are counted once until holidays change"""
+        calculator = SprintCalculator(holiday_manager)
+        member = SimpleNamespace(name="Alice")
+        week = (date(2025, 4, 28), date(2025, 5, 4))
+        count = mocker.spy(holiday_manager, "count_holiday_weekdays")
+
+        assert calculator.calculate_working_days(*week, member) == 2
+        assert calculator.calculate_working_days(*week, member) == 2
+        assert calculator.calculate_working_days(*week, SimpleNamespace(name="Bob")) == 3
+        assert count.call_count == 2
+
+        holiday_manager.holidays.append(HolidayInfo(date(2025, 4, 29), "Day Off", is_national=False,
+                                                    affected_members=["Alice"]))
+
+        assert calculator.calculate_working_days(*week, member) == 1
+        assert count.call_count == 3
+
+    def test_cache_follows_same_length_edits(self, holiday_manager):
+        """Test that replacing a holiday invalidates cached counts"""
+        calculator = SprintCalculator(holiday_manager)
+        member = SimpleNamespace(name="Bob")
+        week = (date(2025, 5, 5), date(2025, 5, 11))
+        assert calculator.calculate_working_days(*week, member) == 5
+
+        holiday_manager.holidays[0] = HolidayInfo(date(2025, 5, 5), "Bevrijdingsdag")
+
+        assert calculator.calculate_working_days(*week, member) == 4
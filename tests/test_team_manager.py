@@ -0,0 +1,291 @@
+"""
+Unit tests for team member storage and holiday queries
+"""
+import json
+import os
+import shutil
+import pytest
+from datetime import date
+
+from team.team_manager import Holiday, TeamMember, TeamManager
+
+
+class TestTeamMemberHolidays:
+    """Test holiday range queries on TeamMember"""
+
+    def _member_with_holidays(self):
+        member = TeamMember("Alice Johnson", "Developer")
+        member.add_holiday("2025-07-14", "2025-07-25", "Summer Vacation")
+        member.add_holiday("2025-01-01", "2025-01-01", "New Year's Day", True)
+        member.add_holiday("2025-12-22", "2026-01-02", "Christmas Break")
+        member.add_holiday("2025-03-01", "2025-09-30", "Sabbatical")
+        return member
+
+    def test_holidays_in_range_overlap(self):
+        """Test that only overlapping holidays are returned, ordered by start date"""
+        member = self._member_with_holidays()
+
+        result = member.get_holidays_in_range(date(2025, 7, 1), date(2025, 7, 15))
+
+        assert [h.name for h in result] == ["Sabbatical", "Summer Vacation"]
+
+    def test_holidays_in_range_boundaries(self):
+        """Test that holidays touching the range edges count as overlapping"""
+        member = self._member_with_holidays()
+
+        assert [h.name for h in member.get_holidays_in_range(date(2025, 1, 1), date(2025, 1, 1))] == ["New Year's Day"]
+        assert [h.name for h in member.get_holidays_in_range(date(2026, 1, 2), date(2026, 1, 9))] == ["Christmas Break"]
+        assert member.get_holidays_in_range(date(2025, 10, 1), date(2025, 12, 21)) == []
+
+    def test_holidays_in_range_matches_linear_scan(self):
+        """Test the indexed query against a plain overlap check"""
+        member = self._member_with_holidays()
+
+        for month in range(1, 13):
+            start, end = date(2025, month, 1), date(2025, month, 28)
+            expected = {
+                h.name for h in member.holidays
+                if date.fromisoformat(h.start_date) <= end and date.fromisoformat(h.end_date) >= start
+            }
+            assert {h.name for h in member.get_holidays_in_range(start, end)} == expected
+
+    def test_holidays_appended_directly(self):
+        """Test that holidays added without add_holiday are still found"""
+        member = TeamMember("Bob Smith", "Designer")
+        member.holidays.append(Holiday("2025-05-05", "2025-05-09", "Long Weekend"))
+
+        result = member.get_holidays_in_range(date(2025, 5, 1), date(2025, 5, 31))
+
+        assert [h.name for h in result] == ["Long Weekend"]
+
+    def test_holidays_edited_in_place(self):
+        """Test that replacing or editing a holiday without changing the count refreshes the index"""
+        member = self._member_with_holidays()
+        july = (date(2025, 7, 1), date(2025, 7, 31))
+        assert [h.name for h in member.get_holidays_in_range(*july)] == ["Sabbatical", "Summer Vacation"]
+
+        member.holidays[3] = Holiday("2025-11-01", "2025-11-30", "Sabbatical")
+        assert [h.name for h in member.get_holidays_in_range(*july)] == ["Summer Vacation"]
+
+        member.holidays[0].start_date, member.holidays[0].end_date = "2025-08-04", "2025-08-08"
+        assert member.get_holidays_in_range(*july) == []
+
+        member.holidays = [Holiday("2025-07-31", "2025-08-01", "Long Weekend")] * 4
+        assert [h.name for h in member.get_holidays_in_range(*july)] == ["Long Weekend"] * 4
+
+    def test_index_reused_between_queries(self, mocker):
+        """Test that repeated queries reuse the index until holidays change"""
+        member = self._member_with_holidays()
+        rebuild = mocker.spy(TeamMember, "_rebuild_index")
+
+        for month in range(1, 13):
+            member.get_holidays_in_range(date(2025, month, 1), date(2025, month, 28))
+        assert rebuild.call_count == 1
+
+        member.holidays.pop()
+        assert [h.name for h in member.get_holidays_in_range(date(2025, 7, 1), date(2025, 7, 1))] == []
+        assert rebuild.call_count == 2
+
+    def test_from_dict_builds_index(self):
+        """Test that members loaded from a dict can be queried"""
+        member = TeamMember.from_dict(self._member_with_holidays().to_dict())
+
+        result = member.get_holidays_in_range(date(2025, 12, 31), date(2025, 12, 31))
+
+        assert [h.name for h in result] == ["Christmas Break"]
+
+
+class TestTeamManagerStorage:
+    """Test persistent storage of team members"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return TeamManager(team_folder=str(tmp_path / "members"))
+
+    def test_save_and_list_members(self, manager):
+        """Test that saved members are listed by display name"""
+        manager.save_member(TeamMember("Zoe Adams", "QA"))
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+
+        assert manager.list_members() == ["Alice Johnson", "Zoe Adams"]
+
+    def test_index_tracks_saves_and_deletes(self, manager):
+        """Test that the sidecar index is kept up to date"""
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+        manager.save_member(TeamMember("Bob Smith", "Designer"))
+        manager.delete_member("Alice Johnson")
+
+        with open(manager._index_path) as f:
+            assert json.load(f) == {"bob_smith": "Bob Smith"}
+        assert manager.list_members() == ["Bob Smith"]
+
+    def test_list_members_rebuilds_missing_index(self, manager):
+        """Test that member files without an index are still listed"""
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+        manager.save_member(TeamMember("Bob Smith", "Designer"))
+        os.remove(manager._index_path)
+
+        assert manager.list_members() == ["Alice Johnson", "Bob Smith"]
+        assert os.path.exists(manager._index_path)
+
+    def test_list_members_sees_files_copied_or_removed_by_hand(self, manager, tmp_path):
+        """Test that the index follows member files added or deleted outside TeamManager"""
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+        other = TeamManager(team_folder=str(tmp_path / "other"))
+        other.save_member(TeamMember("Bob Smith", "Designer"))
+
+        os.remove(manager.get_member_file_path("Alice Johnson"))
+        shutil.copy(other.get_member_file_path("Bob Smith"), manager.team_folder)
+
+        assert manager.list_members() == [m.name for m in manager.load_all_members()] == ["Bob Smith"]
+        with open(manager._index_path) as f:
+            assert json.load(f) == {"bob_smith": "Bob Smith"}
+
+    def test_index_name_is_reserved(self, manager, capsys):
+        """Test that a member cannot overwrite the index file"""
+        assert manager.save_member(TeamMember("_Index", "Developer")) is False
+        assert "reserved" in capsys.readouterr().out
+        assert manager.list_members() == []
+
+    def test_load_all_members(self, manager):
+        """Test loading every member with holidays in one pass"""
+        bob = TeamMember("Bob Smith", "Designer", availability=0.5)
+        bob.add_holiday("2025-08-04", "2025-08-15", "Summer Vacation")
+        manager.save_member(bob)
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+
+        members = manager.load_all_members()
+
+        assert [m.name for m in members] == ["Alice Johnson", "Bob Smith"]
+        assert members[1].availability == 0.5
+        assert [h.name for h in members[1].holidays] == ["Summer Vacation"]
+
+    def test_save_member_is_atomic_and_compact(self, manager):
+        """Test that saves leave no temp file behind and default to compact JSON"""
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+        manager.save_member(TeamMember("Bob Smith", "Designer"), pretty=True)
+
+        assert sorted(os.listdir(manager.team_folder)) == ["_index.json", "alice_johnson.json", "bob_smith.json"]
+        with open(manager.get_member_file_path("Alice Johnson")) as f:
+            assert "\n" not in f.read()
+        with open(manager.get_member_file_path("Bob Smith")) as f:
+            assert f.read().startswith('{\n  "name": "Bob Smith"')
+
+    def test_failed_save_leaves_no_temp_file(self, manager):
+        """Test that a save that cannot be serialized cleans up and keeps the old file"""
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+
+        assert manager.save_member(TeamMember("Alice Johnson", "Developer", email=object())) is False
+
+        assert sorted(os.listdir(manager.team_folder)) == ["_index.json", "alice_johnson.json"]
+        assert manager.load_member("Alice Johnson").email is None
+
+    def test_index_write_failure_does_not_fail_save(self, manager, mocker, capsys):
+        """Test that a member saved to disk counts as saved even if the index cannot be written"""
+        mocker.patch.object(manager, "_write_index", side_effect=OSError("disk full"))
+
+        assert manager.save_member(TeamMember("Alice Johnson", "Developer")) is True
+        assert "Could not update team member index" in capsys.readouterr().out
+
+        mocker.stopall()
+        assert manager.list_members() == ["Alice Johnson"]
+
+    @pytest.mark.parametrize("name,expected", [
+        ("Alice Johnson", "alice_johnson.json"),
+        ("O'Brien-Smith, Jr.", "obrien-smith_jr.json"),
+        ("José Núñez", "josé_núñez.json"),
+        ("Tab\there™", "tabhere.json"),
+    ])
+    def test_member_file_name(self, manager, name, expected):
+        """Test that member names map to safe file names"""
+        assert os.path.basename(manager.get_member_file_path(name)) == expected
+
+    def test_index_rebuild_reads_names_from_file_head(self, manager):
+        """Test that rebuilding the index handles escaped, pretty and hand-written files"""
+        member = TeamMember('Ann "AJ" O\\Neil', "Developer")
+        for i in range(100):
+            member.add_holiday("2025-01-01", "2025-01-02", f"Day {i}")
+        manager.save_member(member)
+        manager.save_member(TeamMember("Bob Smith", "Designer"), pretty=True)
+        with open(os.path.join(manager.team_folder, "carol.json"), "w") as f:
+            json.dump({"role": "QA", "name": "Carol"}, f)
+        os.remove(manager._index_path)
+
+        assert manager.list_members() == ['Ann "AJ" O\\Neil', "Bob Smith", "Carol"]
+
+    def test_quiet_by_default(self, manager, capsys):
+        """Test that programmatic saves and deletes print nothing unless verbose"""
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+        manager.delete_member("Alice Johnson")
+        manager.delete_member("Nobody")
+        assert capsys.readouterr().out == ""
+
+        manager.verbose = True
+        manager.save_member(TeamMember("Bob Smith", "Designer"))
+        assert "Saved team member: Bob Smith" in capsys.readouterr().out
+
+    def test_snapshot_keys_members_by_name(self, manager):
+        """Test that snapshot loads every member once, keyed and ordered by name"""
+        manager.save_member(TeamMember("Zoe Adams", "QA"))
+        manager.save_member(TeamMember("Alice Johnson", "Developer"))
+
+        members = manager.snapshot()
+
+        assert list(members) == ["Alice Johnson", "Zoe Adams"]
+        assert members["Zoe Adams"].role == "QA"
+
+    def test_date_input_retries_until_valid(self, manager, monkeypatch, capsys):
+        """Test that date prompts re-ask on bad input and accept unpadded dates"""
+        answers = iter(["25-12-2024", "2024-12-5"])
+        monkeypatch.setattr("builtins.input", lambda prompt: next(answers))
+
+        assert manager._get_date_input("Start date (YYYY-MM-DD): ") == date(2024, 12, 5)
+        assert "Invalid date format" in capsys.readouterr().out
+
+    def test_missing_member(self, manager, capsys):
+        """Test that loading or deleting an unknown member fails quietly"""
+        assert manager.load_member("Nobody") is None
+        assert manager.delete_member("Nobody") is False
+        assert capsys.readouterr().out == ""
+
+
+class TestTeamMemberSerialization:
+    """Test that cached holiday data never leaks into stored members"""
+
+    def test_to_dict_round_trip(self):
+        """Test that to_dict only holds public fields and round-trips through from_dict"""
+        member = TeamMember("Alice Johnson", "Developer", email="alice@example.com")
+        member.add_holiday("2025-07-14", "2025-07-25", "Summer Vacation")
+
+        data = member.to_dict()
+
+        assert set(data) == {"name", "role", "availability", "story_points_per_sprint",
+                             "hourly_rate", "email", "holidays"}
+        assert data["holidays"] == [{"start_date": "2025-07-14", "end_date": "2025-07-25",
+                                     "name": "Summer Vacation", "is_national": False}]
+        assert TeamMember.from_dict(json.loads(json.dumps(data))) == member
+
+    def test_records_use_slots(self):
+        """Test that members and holidays do not carry a per-instance __dict__"""
+        member = TeamMember("Alice Johnson", "Developer")
+        member.add_holiday("2025-07-14", "2025-07-25", "Summer Vacation")
+
+        assert not hasattr(member, "__dict__")
+        assert not hasattr(member.holidays[0], "__dict__")
+
+    def test_fast_new_matches_constructor(self):
+        """Test that bulk-loaded holidays equal constructed ones"""
+        data = {"start_date": "2025-07-14", "end_date": "2025-07-25", "name": "Summer Vacation"}
+
+        assert Holiday._fast_new(data) == Holiday(**data)
+
+    def test_bad_holiday_date_does_not_abort_load(self):
+        """Test that a malformed holiday only fails queries, not loading the member"""
+        data = TeamMember("Alice Johnson", "Developer").to_dict()
+        data["holidays"] = [{"start_date": "soon", "end_date": "2025-07-25", "name": "Summer Vacation"}]
+
+        member = TeamMember.from_dict(data)
+
+        assert member.holidays[0].start_date == "soon"
+        with pytest.raises(ValueError):
+            member.get_holidays_in_range(date(2025, 7, 1), date(2025, 7, 31))
@@ -4,16 +4,12 @@ Tests for Timeline Generator functionality
 """
 
 import pytest
-import sys
 import os
 from datetime import date, timedelta
 from unittest.mock import Mock, patch, MagicMock
 import tempfile
 import openpyxl
 
-# Add project root to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
-
 from timeline.timeline_generator import (
     TimelineGenerator, TeamMemberInfo, HolidayInfo, Sprint,
     DutchHolidayAPI
@@ -5,10 +5,71 @@ Handles creating monthly calendar views with project timeline data
 """
 
 import calendar
-from datetime import date, timedelta
-from typing import List, Optional
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
 import openpyxl
-from openpyxl.styles import PatternFill, Alignment, Border, Side, Font
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import PatternFill, Alignment, Border, Side, Font, NamedStyle
+
+
+_FILL_HOLIDAY = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
+_FILL_SPRINT = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
+_FILL_WEEKEND = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+_FONT_TITLE = Font(size=14, bold=True)
+_FONT_MONTH = Font(size=12, bold=True)
+_FONT_BOLD = Font(bold=True)
+_ALIGN_CENTER = Alignment(horizontal="center")
+_ALIGN_DAY = Alignment(horizontal="center", vertical="center")
+
+# Named cell styles for calendar days, keyed by name with their fill
+CALENDAR_DAY_STYLES = {
+    "Calendar Day": None,
+    "Calendar Holiday": _FILL_HOLIDAY,
+    "Calendar Sprint": _FILL_SPRINT,
+    "Calendar Weekend": _FILL_WEEKEND,
+}
+
+
+_MONDAY_CALENDAR = calendar.Calendar(firstweekday=0)
+
+
+@lru_cache(maxsize=256)
+def _month_matrix(year: int, month: int) -> Tuple[Tuple[Optional[int], ...], ...]:
+    """Monday-first weeks of a month as day numbers, with None for days of the neighbouring months"""
+    days = [day or None for day in _MONDAY_CALENDAR.itermonthdays(year, month)]
+    return tuple(tuple(days[i:i + 7]) for i in range(0, len(days), 7))
+
+
+def _styled_cell(ws, value, font=None, fill=None, alignment=None) -> WriteOnlyCell:
+    """Build a cell for ws.append with the given styles"""
+    cell = WriteOnlyCell(ws, value=value)
+    if font:
+        cell.font = font
+    if fill:
+        cell.fill = fill
+    if alignment:
+        cell.alignment = alignment
+    return cell
+
+
+def _register_calendar_styles(workbook: openpyxl.Workbook):
+    """Add the calendar day styles to a workbook once"""
+    for name, fill in CALENDAR_DAY_STYLES.items():
+        if name in workbook.named_styles:
+            continue
+        style = NamedStyle(name=name)
+        style.alignment = _ALIGN_DAY
+        style.border = _THIN_BORDER
+        if fill:
+            style.fill = fill
+        workbook.add_named_style(style)
 
 
 class CalendarGenerator:
@@ -21,103 +82,95 @@ class CalendarGenerator:
     def create_calendar_view_sheet(self, workbook: openpyxl.Workbook, 
                                  project_start_date: Optional[date], 
                                  project_end_date: Optional[date]):
-        """Create a calendar view showing team availability and project timeline"""
+        """Create a calendar view showing team availability and project timeline
+        
+        Rows are only ever appended, so this works on write-only workbooks too.
+        """
         ws = workbook.create_sheet("Calendar View")
         
         if not project_start_date or not project_end_date:
-            ws.cell(row=1, column=1, value="No project timeline generated yet")
+            ws.append(["No project timeline generated yet"])
             return
         
+        _register_calendar_styles(workbook)
+        
+        # Column widths must be set before the first row is written
+        for col in range(1, 8):
+            ws.column_dimensions[openpyxl.utils.get_column_letter(col)].width = 6
+        
         # Title
-        ws.cell(row=1, column=1, value=f"Project Calendar: {project_start_date} to {project_end_date}")
-        ws.cell(row=1, column=1).font = Font(size=14, bold=True)
+        ws.append([_styled_cell(ws, f"Project Calendar: {project_start_date} to {project_end_date}", font=_FONT_TITLE)])
         
         # Legend
-        ws.cell(row=2, column=1, value="Legend:")
-        ws.cell(row=2, column=2, value="Sprint Days")
-        ws.cell(row=2, column=2).fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-        ws.cell(row=2, column=3, value="Holidays")
-        ws.cell(row=2, column=3).fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
-        ws.cell(row=2, column=4, value="Weekends")
-        ws.cell(row=2, column=4).fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
+        ws.append([
+            "Legend:",
+            _styled_cell(ws, "Sprint Days", fill=_FILL_SPRINT),
+            _styled_cell(ws, "Holidays", fill=_FILL_HOLIDAY),
+            _styled_cell(ws, "Weekends", fill=_FILL_WEEKEND),
+        ])
         
         # Generate monthly calendar views
         current_month = project_start_date.replace(day=1)
         end_month = project_end_date.replace(day=1)
-        row_offset = 5
+        
+        # Precompute day lookups for every month shown, indexed by ordinal - base
+        base = current_month.toordinal()
+        last = end_month.toordinal() + calendar.monthrange(end_month.year, end_month.month)[1] - 1
+        holiday_ords = {h.date.toordinal() for h in self.holiday_manager.holidays if h.is_national}
+        sprint_bits = bytearray(last - base + 1)
+        for sprint in self.sprints:
+            first_bit = max(sprint.start_date.toordinal(), base) - base
+            last_bit = min(sprint.end_date.toordinal(), last) - base
+            if first_bit <= last_bit:
+                sprint_bits[first_bit:last_bit + 1] = b'\x01' * (last_bit - first_bit + 1)
         
         while current_month <= end_month:
-            row_offset = self._create_monthly_calendar(ws, current_month, row_offset)
+            # Two blank rows before each month
+            ws.append([])
+            ws.append([])
+            self._create_monthly_calendar(ws, current_month, holiday_ords, sprint_bits, base)
             # Move to next month
             if current_month.month == 12:
                 current_month = current_month.replace(year=current_month.year + 1, month=1)
             else:
                 current_month = current_month.replace(month=current_month.month + 1)
     
-    def _create_monthly_calendar(self, ws: openpyxl.Workbook, month_date: date, start_row: int) -> int:
-        """Create a single month calendar view"""
-        month_name = month_date.strftime("%B %Y")
+    def _create_monthly_calendar(self, ws, month_date: date,
+                                 holiday_ords: Set[int], sprint_bits: bytearray, base: int):
+        """Append a single month calendar view
         
+        holiday_ords holds the ordinals of national holidays and sprint_bits
+        flags sprint days by ordinal - base.
+        """
         # Month header
-        ws.cell(row=start_row, column=1, value=month_name)
-        ws.cell(row=start_row, column=1).font = Font(size=12, bold=True)
+        ws.append([_styled_cell(ws, month_date.strftime("%B %Y"), font=_FONT_MONTH)])
         
         # Day headers
         day_headers = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-        for col, day in enumerate(day_headers, 1):
-            cell = ws.cell(row=start_row + 1, column=col, value=day)
-            cell.font = Font(bold=True)
-            cell.alignment = Alignment(horizontal="center")
+        ws.append([_styled_cell(ws, day, font=_FONT_BOLD, alignment=_ALIGN_CENTER) for day in day_headers])
         
-        # Get calendar for this month
-        cal = calendar.monthcalendar(month_date.year, month_date.month)
-        
-        # Fill in the calendar
-        for week_num, week in enumerate(cal):
-            row = start_row + 2 + week_num
-            for day_num, day in enumerate(week):
-                col = day_num + 1
-                
-                if day == 0:
-                    continue  # Empty cell for days not in this month
-                
-                current_date = date(month_date.year, month_date.month, day)
-                cell = ws.cell(row=row, column=col, value=day)
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+        # Fill in the calendar; columns run Monday to Sunday, so the column is the weekday
+        first_ord = month_date.replace(day=1).toordinal() - 1
+        for week in _month_matrix(month_date.year, month_date.month):
+            row = []
+            for weekday, day in enumerate(week):
+                if day is None:
+                    row.append(None)  # Empty cell for days not in this month
+                    continue
                 
-                # Check if this date is special
-                cell_fill = None
+                day_ord = first_ord + day
                 
-                # Check for holidays
-                if self.holiday_manager.is_holiday(current_date):
-                    cell_fill = PatternFill(start_color="FFE6E6", end_color="FFE6E6", fill_type="solid")
+                # Holidays take precedence over sprint days, which take precedence over weekends
+                if day_ord in holiday_ords:
+                    style = "Calendar Holiday"
+                elif sprint_bits[day_ord - base]:
+                    style = "Calendar Sprint"
+                elif weekday >= 5:  # Saturday = 5, Sunday = 6
+                    style = "Calendar Weekend"
+                else:
+                    style = "Calendar Day"
                 
-                # Check for sprint dates
-                for sprint in self.sprints:
-                    if sprint.start_date <= current_date <= sprint.end_date:
-                        if cell_fill is None:  # Don't override holiday colors
-                            cell_fill = PatternFill(start_color="E6F3FF", end_color="E6F3FF", fill_type="solid")
-                        break
-                
-                # Check for weekends
-                if current_date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-                    if cell_fill is None:
-                        cell_fill = PatternFill(start_color="F5F5F5", end_color="F5F5F5", fill_type="solid")
-                
-                if cell_fill:
-                    cell.fill = cell_fill
-                
-                # Add border
-                cell.border = Border(
-                    left=Side(style='thin'),
-                    right=Side(style='thin'),
-                    top=Side(style='thin'),
-                    bottom=Side(style='thin')
-                )
-        
-        # Set column widths
-        for col in range(1, 8):
-            column_letter = openpyxl.utils.get_column_letter(col)
-            ws.column_dimensions[column_letter].width = 6
-        
-        return start_row + len(cal) + 4  # Return next available row 
\ No newline at end of file
+                cell = WriteOnlyCell(ws, value=day)
+                cell.style = style
+                row.append(cell)
+            ws.append(row)
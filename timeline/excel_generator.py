@@ -5,9 +5,15 @@ Handles creating and formatting Excel workbooks with timeline data
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+
+_FONT_HEADER = Font(color="FFFFFF", bold=True)
+_FILL_HEADER = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
+_FONT_BOLD = Font(bold=True)
 
 
 class ExcelGenerator:
@@ -32,10 +38,8 @@ class ExcelGenerator:
         
         print(f"📊 Creating timeline workbook: {filename}")
         
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
+        # Write-only workbooks stream rows to disk instead of keeping every cell in memory
+        wb = openpyxl.Workbook(write_only=True)
         
         # Create all sheets
         self._create_team_members_sheet(wb)
@@ -53,97 +57,96 @@ class ExcelGenerator:
         """Create team members sheet with enhanced information"""
         ws = wb.create_sheet("Team Members")
         
-        # Headers
         headers = ["Name", "Role", "Availability", "SP/Sprint", "Hourly Rate", "Email", "Holidays"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Team member data
-        for row, member in enumerate(self.team_members, 2):
-            ws.cell(row=row, column=1, value=member.name)
-            ws.cell(row=row, column=2, value=member.role)
-            ws.cell(row=row, column=3, value=f"{member.availability*100:.0f}%")
-            ws.cell(row=row, column=4, value=member.story_points_per_sprint)
-            ws.cell(row=row, column=5, value=f"€{member.hourly_rate:.2f}")
-            ws.cell(row=row, column=6, value=member.email or "")
-            ws.cell(row=row, column=7, value=len(member.holidays))
-        
-        # Auto-size columns
-        self._auto_size_columns(ws)
+        rows = [
+            [
+                member.name,
+                member.role,
+                f"{member.availability*100:.0f}%",
+                member.story_points_per_sprint,
+                f"€{member.hourly_rate:.2f}",
+                member.email or "",
+                len(member.holidays),
+            ]
+            for member in self.team_members
+        ]
+        
+        self._write_table(ws, headers, rows)
     
     def _create_holidays_sheet(self, wb: openpyxl.Workbook):
         """Create holidays sheet"""
         ws = wb.create_sheet("Holidays")
         
-        # Headers
         headers = ["Date", "Name", "Type", "Affected Members"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
-        
-        # Holiday data
         sorted_holidays = sorted(self.holiday_manager.holidays, key=lambda h: h.date)
-        for row, holiday in enumerate(sorted_holidays, 2):
-            ws.cell(row=row, column=1, value=holiday.date.strftime("%Y-%m-%d"))
-            ws.cell(row=row, column=2, value=holiday.name)
-            ws.cell(row=row, column=3, value="National" if holiday.is_national else "Personal")
-            ws.cell(row=row, column=4, value=", ".join(holiday.affected_members) if holiday.affected_members else "Everyone")
-        
-        # Auto-size columns
-        self._auto_size_columns(ws)
+        rows = [
+            [
+                holiday.date.strftime("%Y-%m-%d"),
+                holiday.name,
+                "National" if holiday.is_national else "Personal",
+                ", ".join(holiday.affected_members) if holiday.affected_members else "Everyone",
+            ]
+            for holiday in sorted_holidays
+        ]
+        
+        self._write_table(ws, headers, rows)
     
     def _create_sprint_timeline_sheet(self, wb: openpyxl.Workbook):
         """Create sprint timeline sheet (main timeline view)"""
         ws = wb.create_sheet("Sprint Timeline")
         
-        # Headers
         headers = ["Sprint", "Start Date", "End Date", "Story Points", "Team Velocity", "Duration (Days)", "Capacity Utilization"]
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(start_color="4F81BD", end_color="4F81BD", fill_type="solid")
-            cell.font = Font(color="FFFFFF", bold=True)
         
         # Sprint data
-        for row, sprint in enumerate(self.sprints, 2):
+        rows = []
+        for sprint in self.sprints:
             duration = (sprint.end_date - sprint.start_date).days + 1
             utilization = (sprint.story_points / sprint.team_velocity * 100) if sprint.team_velocity > 0 else 0
-            
-            ws.cell(row=row, column=1, value=f"Sprint {sprint.number}")
-            ws.cell(row=row, column=2, value=sprint.start_date.strftime("%Y-%m-%d"))
-            ws.cell(row=row, column=3, value=sprint.end_date.strftime("%Y-%m-%d"))
-            ws.cell(row=row, column=4, value=sprint.story_points)
-            ws.cell(row=row, column=5, value=sprint.team_velocity)
-            ws.cell(row=row, column=6, value=duration)
-            ws.cell(row=row, column=7, value=f"{utilization:.1f}%")
-        
-        # Summary row
+            rows.append([
+                f"Sprint {sprint.number}",
+                sprint.start_date.strftime("%Y-%m-%d"),
+                sprint.end_date.strftime("%Y-%m-%d"),
+                sprint.story_points,
+                sprint.team_velocity,
+                duration,
+                f"{utilization:.1f}%",
+            ])
+        
+        # Summary row, after one blank row
         if self.sprints:
-            summary_row = len(self.sprints) + 3
-            ws.cell(row=summary_row, column=1, value="TOTAL")
-            ws.cell(row=summary_row, column=1).font = Font(bold=True)
-            ws.cell(row=summary_row, column=4, value=sum(s.story_points for s in self.sprints))
+            total = WriteOnlyCell(ws, value="TOTAL")
+            total.font = _FONT_BOLD
+            summary = [total, None, None, sum(s.story_points for s in self.sprints)]
             if self.project_start_date and self.project_end_date:
-                ws.cell(row=summary_row, column=6, value=(self.project_end_date - self.project_start_date).days + 1)
+                summary += [None, (self.project_end_date - self.project_start_date).days + 1]
+            rows += [[], summary]
         
-        # Auto-size columns
-        self._auto_size_columns(ws)
+        self._write_table(ws, headers, rows)
+    
+    def _write_table(self, ws, headers: List[str], rows: List[list]):
+        """Append a styled header row and data rows, sizing columns to fit"""
+        # Column widths must be set before the first row is written
+        for column_letter, width in self._column_widths([headers] + rows).items():
+            ws.column_dimensions[column_letter].width = width
+        
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = _FONT_HEADER
+            cell.fill = _FILL_HEADER
+            header_cells.append(cell)
+        ws.append(header_cells)
+        
+        for row in rows:
+            ws.append(row)
     
-    def _auto_size_columns(self, ws):
+    def _column_widths(self, rows: List[list]) -> Dict[str, int]:
         """Auto-size columns for better readability"""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 30)
-            ws.column_dimensions[column_letter].width = adjusted_width 
\ No newline at end of file
+        max_lengths: Dict[int, int] = {}
+        for row in rows:
+            for col, value in enumerate(row, 1):
+                if isinstance(value, Cell):
+                    value = value.value
+                if value is not None:
+                    max_lengths[col] = max(max_lengths.get(col, 0), len(str(value)))
+        return {get_column_letter(col): min(length + 2, 30) for col, length in max_lengths.items()}
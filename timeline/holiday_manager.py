@@ -4,11 +4,19 @@ Holiday Management for Timeline Generation
 Handles fetching and managing national and personal holidays
 """
 
+import json
+import os
 import requests
-from datetime import datetime, date
-from typing import List
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bisect import bisect_left, bisect_right
+from datetime import datetime, date, timedelta
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 
+# Fetched holidays are kept on disk per year so later runs skip the API
+HOLIDAY_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "rick-pm")
+
 
 @dataclass
 class HolidayInfo:
@@ -22,31 +30,89 @@ class HolidayInfo:
 class DutchHolidayAPI:
     """Fetches Dutch national holidays from open API"""
     
+    cache_dir = HOLIDAY_CACHE_DIR
+    # (ISO date, name) pairs per year; fresh HolidayInfo objects are built for every caller
+    _year_cache: Dict[int, List[Tuple[str, str]]] = {}
+    # Shared keep-alive session, so fetching several years reuses one connection
+    _session: Optional[requests.Session] = None
+    
+    @staticmethod
+    def _get_session() -> requests.Session:
+        """Create the shared HTTP session on first use"""
+        if DutchHolidayAPI._session is None:
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                                  max_retries=Retry(total=2, backoff_factor=0.3)))
+            DutchHolidayAPI._session = session
+        return DutchHolidayAPI._session
+    
     @staticmethod
     def fetch_holidays(year: int) -> List[HolidayInfo]:
         """Fetch Dutch holidays for a specific year"""
-        try:
-            # Using Nederlandse feestdagen API
-            url = f"https://date.nager.at/api/v3/PublicHolidays/{year}/NL"
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            
-            holidays = []
-            for holiday_data in response.json():
-                holiday_date = datetime.strptime(holiday_data['date'], '%Y-%m-%d').date()
-                holidays.append(HolidayInfo(
-                    date=holiday_date,
-                    name=holiday_data['name'],
-                    is_national=True
-                ))
-            
-            print(f"📅 Fetched {len(holidays)} Dutch national holidays for {year}")
-            return holidays
+        entries = DutchHolidayAPI._load_cached(year)
+        
+        if entries is None:
+            try:
+                # Using Nederlandse feestdagen API
+                url = f"https://date.nager.at/api/v3/PublicHolidays/{year}/NL"
+                response = DutchHolidayAPI._get_session().get(url, timeout=10)
+                response.raise_for_status()
+                
+                entries = [(holiday_data['date'], holiday_data['name']) for holiday_data in response.json()]
+                print(f"📅 Fetched {len(entries)} Dutch national holidays for {year}")
+                
+            except Exception as e:
+                print(f"⚠️  Could not fetch Dutch holidays for {year}: {e}")
+                # Return some common Dutch holidays as fallback (not cached, so a later run retries)
+                return DutchHolidayAPI._get_fallback_holidays(year)
             
-        except Exception as e:
-            print(f"⚠️  Could not fetch Dutch holidays for {year}: {e}")
-            # Return some common Dutch holidays as fallback
-            return DutchHolidayAPI._get_fallback_holidays(year)
+            DutchHolidayAPI._store_cached(year, entries)
+        
+        return [
+            HolidayInfo(date=datetime.strptime(holiday_date, '%Y-%m-%d').date(), name=name, is_national=True)
+            for holiday_date, name in entries
+        ]
+    
+    @staticmethod
+    def clear_cache():
+        """Forget holidays cached in this process (the on-disk cache is kept)"""
+        DutchHolidayAPI._year_cache.clear()
+    
+    @staticmethod
+    def _cache_path(year: int) -> str:
+        """On-disk cache file for a year"""
+        return os.path.join(DutchHolidayAPI.cache_dir, f"holidays_{year}.json")
+    
+    @staticmethod
+    def _load_cached(year: int) -> Optional[List[Tuple[str, str]]]:
+        """Cached holidays for a year from memory or disk, or None on a miss"""
+        entries = DutchHolidayAPI._year_cache.get(year)
+        if entries is not None:
+            return entries
+        
+        try:
+            with open(DutchHolidayAPI._cache_path(year), 'rb') as f:
+                entries = [(holiday_date, name) for holiday_date, name in json.loads(f.read())]
+        except (OSError, ValueError, TypeError):
+            return None  # Missing or unreadable cache file
+        
+        DutchHolidayAPI._year_cache[year] = entries
+        return entries
+    
+    @staticmethod
+    def _store_cached(year: int, entries: List[Tuple[str, str]]):
+        """Remember fetched holidays in memory and, best effort, on disk"""
+        DutchHolidayAPI._year_cache[year] = entries
+        
+        file_path = DutchHolidayAPI._cache_path(year)
+        tmp_path = file_path + '.tmp'
+        try:
+            os.makedirs(DutchHolidayAPI.cache_dir, exist_ok=True)
+            with open(tmp_path, 'w') as f:
+                json.dump(entries, f, separators=(',', ':'))
+            os.replace(tmp_path, file_path)
+        except OSError:
+            pass  # A read-only home only means the next run fetches again
     
     @staticmethod
     def _get_fallback_holidays(year: int) -> List[HolidayInfo]:
@@ -74,11 +140,79 @@ class DutchHolidayAPI:
         return holidays
 
 
+class _HolidayList(list):
+    """List of holidays that bumps its HolidayManager's version on every change"""
+    
+    def __init__(self, manager: 'HolidayManager', holidays=()):
+        super().__init__(holidays)
+        self._manager = manager
+
+
+def _bump_version(method):
+    """Wrap a list method so it bumps the owning manager's version first"""
+    def mutate(self, *args, **kwargs):
+        self._manager._version += 1
+        return method(self, *args, **kwargs)
+    mutate.__name__ = method.__name__
+    return mutate
+
+
+for _name in ('append', 'extend', 'insert', 'remove', 'pop', 'clear', 'sort', 'reverse',
+              '__setitem__', '__delitem__', '__iadd__', '__imul__'):
+    setattr(_HolidayList, _name, _bump_version(getattr(list, _name)))
+
+
 class HolidayManager:
-    """Manages all holiday-related functionality for timeline generation"""
+    """Manages all holiday-related functionality for timeline generation
+    
+    Every change to holidays, through the methods below or directly on the list,
+    bumps version so derived data can be cached. Replace a HolidayInfo instead of
+    editing its fields in place.
+    """
     
     def __init__(self):
-        self.holidays: List[HolidayInfo] = []
+        self._version = 0
+        self._holidays = _HolidayList(self)
+        # Sorted ordinals of weekday holidays, national and per member; rebuilt when the version changes
+        self._indexed_version = -1
+        self._national_weekdays: List[int] = []
+        self._member_weekdays: Dict[str, List[int]] = {}
+    
+    @property
+    def holidays(self) -> List[HolidayInfo]:
+        return self._holidays
+    
+    @holidays.setter
+    def holidays(self, holidays: List[HolidayInfo]):
+        self._holidays = _HolidayList(self, holidays)
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Counter bumped on every change to holidays"""
+        return self._version
+    
+    def _refresh_index(self):
+        """Rebuild the weekday holiday index if holidays changed since the last build"""
+        if self._indexed_version == self._version:
+            return
+        
+        national = set()
+        personal: Dict[str, set] = {}
+        for holiday in self.holidays:
+            if holiday.date.weekday() >= 5:
+                continue  # Weekends are never working days anyway
+            ordinal = holiday.date.toordinal()
+            if holiday.is_national:
+                national.add(ordinal)
+            else:
+                for member_name in holiday.affected_members:
+                    personal.setdefault(member_name, set()).add(ordinal)
+        
+        self._national_weekdays = sorted(national)
+        # Personal days that are also national holidays must not be counted twice
+        self._member_weekdays = {name: sorted(ordinals - national) for name, ordinals in personal.items()}
+        self._indexed_version = self._version
     
     def load_dutch_holidays(self, start_year: int, end_year: int):
         """Load Dutch national holidays for the project timeline"""
@@ -92,8 +226,7 @@ class HolidayManager:
     
     def add_team_holidays(self, team_members):
         """Convert team member holidays to timeline holidays"""
-        from datetime import timedelta
-        
+        new_holidays = []
         for member in team_members:
             for holiday in member.holidays:
                 # Convert date strings to date objects
@@ -101,16 +234,16 @@ class HolidayManager:
                 end_date = datetime.strptime(holiday.end_date, '%Y-%m-%d').date()
                 
                 # Add each day in the holiday range
-                current_date = start_date
-                while current_date <= end_date:
-                    timeline_holiday = HolidayInfo(
-                        date=current_date,
+                new_holidays.extend([
+                    HolidayInfo(
+                        date=start_date + timedelta(days=offset),
                         name=holiday.name,
                         is_national=holiday.is_national,
                         affected_members=[member.name] if not holiday.is_national else []
                     )
-                    self.holidays.append(timeline_holiday)
-                    current_date += timedelta(days=1)
+                    for offset in range((end_date - start_date).days + 1)
+                ])
+        self.holidays.extend(new_holidays)
     
     def is_holiday(self, check_date: date, member_name: str = None) -> bool:
         """Check if a specific date is a holiday for a member"""
@@ -120,6 +253,17 @@ class HolidayManager:
                     return True
         return False
     
+    def count_holiday_weekdays(self, start_date: date, end_date: date, member_name: str = None) -> int:
+        """Count the distinct weekdays in a date range that are holidays for a member"""
+        self._refresh_index()
+        first, last = start_date.toordinal(), end_date.toordinal()
+        
+        count = bisect_right(self._national_weekdays, last) - bisect_left(self._national_weekdays, first)
+        member_weekdays = self._member_weekdays.get(member_name) if member_name else None
+        if member_weekdays:
+            count += bisect_right(member_weekdays, last) - bisect_left(member_weekdays, first)
+        return count
+    
     def get_holidays_for_range(self, start_date: date, end_date: date) -> List[HolidayInfo]:
         """Get all holidays within a date range"""
         return [h for h in self.holidays if start_date <= h.date <= end_date] 
\ No newline at end of file
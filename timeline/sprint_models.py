@@ -5,10 +5,22 @@ Handles sprint data structures and capacity calculations
 """
 
 from datetime import date, timedelta
-from typing import List
+from typing import Dict, List, Tuple
 from dataclasses import dataclass
 
 
+def count_weekdays(start_date: date, end_date: date) -> int:
+    """Count Monday to Friday dates from start_date to end_date inclusive"""
+    total_days = (end_date - start_date).days + 1
+    if total_days <= 0:
+        return 0
+    
+    # Every full week has five weekdays; check the few leftover days individually
+    full_weeks, extra_days = divmod(total_days, 7)
+    first_weekday = start_date.weekday()
+    return full_weeks * 5 + sum(1 for i in range(extra_days) if (first_weekday + i) % 7 < 5)
+
+
 @dataclass
 class Sprint:
     """Sprint information with dates"""
@@ -25,21 +37,26 @@ class SprintCalculator:
     
     def __init__(self, holiday_manager):
         self.holiday_manager = holiday_manager
+        # Working days per (start ordinal, end ordinal, member name); cleared when holidays change
+        self._working_days_cache: Dict[Tuple[int, int, str], int] = {}
+        self._cached_holidays_version = -1
     
     def calculate_working_days(self, start_date: date, end_date: date, member) -> int:
         """Calculate working days for a team member considering holidays"""
-        working_days = 0
-        current_date = start_date
+        if end_date < start_date:
+            return 0
         
-        while current_date <= end_date:
-            # Check if it's a weekday (Monday = 0, Sunday = 6)
-            if current_date.weekday() < 5:  # Monday to Friday
-                # Check if member is on holiday
-                if not self.holiday_manager.is_holiday(current_date, member.name):
-                    working_days += 1
-            
-            current_date += timedelta(days=1)
+        if self._cached_holidays_version != self.holiday_manager.version:
+            self._working_days_cache.clear()
+            self._cached_holidays_version = self.holiday_manager.version
         
+        key = (start_date.toordinal(), end_date.toordinal(), member.name)
+        working_days = self._working_days_cache.get(key)
+        if working_days is None:
+            # Weekdays in the range minus the member's (national or personal) holidays on weekdays
+            holidays = self.holiday_manager.count_holiday_weekdays(start_date, end_date, member.name)
+            working_days = count_weekdays(start_date, end_date) - holidays
+            self._working_days_cache[key] = working_days
         return working_days
     
     def calculate_effective_capacity(self, member, start_date: date, end_date: date) -> float:
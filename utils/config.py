@@ -1,9 +1,26 @@
 import os
+from functools import lru_cache
+from typing import Tuple
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+@lru_cache(maxsize=4)
+def _missing_required_fields(domain: str, email: str, api_token: str, project_key: str) -> Tuple[str, ...]:
+    """Names of required Jira settings that are unset or still placeholders (cached per value set)"""
+    required_fields = [
+        ('JIRA_DOMAIN', domain),
+        ('JIRA_EMAIL', email), 
+        ('JIRA_API_TOKEN', api_token),
+        ('JIRA_PROJECT_KEY', project_key)
+    ]
+    
+    return tuple(
+        field_name for field_name, field_value in required_fields
+        if not field_value or field_value.startswith('your-')
+    )
+
 class JiraConfig:
     """Configuration class for Jira API settings"""
     
@@ -26,17 +43,7 @@ class JiraConfig:
     
     def validate(self):
         """Validate that all required settings are provided"""
-        required_fields = [
-            ('JIRA_DOMAIN', self.domain),
-            ('JIRA_EMAIL', self.email), 
-            ('JIRA_API_TOKEN', self.api_token),
-            ('JIRA_PROJECT_KEY', self.project_key)
-        ]
-        
-        missing_fields = []
-        for field_name, field_value in required_fields:
-            if not field_value or field_value.startswith('your-'):
-                missing_fields.append(field_name)
+        missing_fields = _missing_required_fields(self.domain, self.email, self.api_token, self.project_key)
         
         if missing_fields:
             raise ValueError(f"Missing required configuration: {', '.join(missing_fields)}. Please update your .env file.")